@@ -35,7 +35,7 @@ from .config import (
 from .io import read_image
 from .ssim import calc_ssim
 from .align import align_images, align_images_detailed
-from .pixel_match import run_pixel_matching, run_pixel_matching_multiscale
+from .pixel_match import run_pixel_matching, run_pixel_matching_multiscale, prepare_gray_pair
 from .illumination import (
     apply_light_sensitivity_mode,
     preprocess_pair,
@@ -43,7 +43,8 @@ from .illumination import (
     apply_clahe,
     gamma_correction,
     gold_pad_hsv_filter,
-    get_gold_pad_mask
+    get_gold_pad_mask,
+    close_open_mask
 )
 from .edge_detection import run_edge_detection
 from .grid_analyzer import GridAnalyzer
@@ -56,10 +57,11 @@ __all__ = [
     'SSIMConfig', 'InspectionConfig', 'get_default_config',
     # Core
     'read_image', 'calc_ssim', 'align_images', 'align_images_detailed',
-    'run_pixel_matching', 'run_pixel_matching_multiscale',
+    'run_pixel_matching', 'run_pixel_matching_multiscale', 'prepare_gray_pair',
     # Illumination
     'apply_light_sensitivity_mode', 'preprocess_pair', 'match_histograms',
     'apply_clahe', 'gamma_correction', 'gold_pad_hsv_filter', 'get_gold_pad_mask',
+    'close_open_mask',
     # Detection
     'run_edge_detection', 'GridAnalyzer',
     # GUI
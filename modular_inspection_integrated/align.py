@@ -50,12 +50,12 @@ def align_images(
     if config is None:
         config = AlignmentConfig()
     
-    # Resize test to match golden
+    # Resize test to match golden (callers often pass it pre-sized)
     h_golden, w_golden = golden_image.shape[:2]
-    test_resized = cv2.resize(test_image, (w_golden, h_golden))
-    
-    # Full mask for fallback
-    full_mask = np.ones((h_golden, w_golden), dtype=np.uint8) * 255
+    if test_image.shape[:2] == (h_golden, w_golden):
+        test_resized = test_image
+    else:
+        test_resized = cv2.resize(test_image, (w_golden, h_golden))
     
     # Try methods in order for AUTO mode
     if method == AlignmentMethod.AUTO:
@@ -116,11 +116,15 @@ def _align_phase_correlation(
         return test, (0.0, 0.0), float(response), full_mask
     
     # Apply translation
-    M = np.float32([[1, 0, -dx], [0, 1, -dy]])
-    aligned = cv2.warpAffine(test, M, (w, h), borderValue=(0, 0, 0))
-    
-    # Valid mask
-    valid_mask = cv2.warpAffine(full_mask, M, (w, h), borderValue=0)
+    shift = _integer_shift(dx, dy)
+    if shift is not None:
+        aligned, valid_mask = _translate(test, *shift)
+    else:
+        M = np.float32([[1, 0, -dx], [0, 1, -dy]])
+        aligned = cv2.warpAffine(test, M, (w, h), borderValue=(0, 0, 0))
+        
+        # Valid mask
+        valid_mask = cv2.warpAffine(full_mask, M, (w, h), borderValue=0)
     
     return aligned, (float(dx), float(dy)), float(response), valid_mask
 
@@ -190,8 +194,7 @@ def _align_orb(
                                    borderValue=border_value)
     
     # Create valid mask
-    dummy = np.ones((h, w), dtype=np.uint8) * 255
-    valid_mask = cv2.warpPerspective(dummy, H, (w, h),
+    valid_mask = cv2.warpPerspective(full_mask, H, (w, h),
                                       flags=cv2.INTER_LINEAR,
                                       borderMode=cv2.BORDER_CONSTANT,
                                       borderValue=0)
@@ -264,8 +267,7 @@ def _align_sift(
                                    borderMode=cv2.BORDER_CONSTANT,
                                    borderValue=border_value)
     
-    dummy = np.ones((h, w), dtype=np.uint8) * 255
-    valid_mask = cv2.warpPerspective(dummy, H, (w, h),
+    valid_mask = cv2.warpPerspective(full_mask, H, (w, h),
                                       flags=cv2.INTER_LINEAR,
                                       borderValue=0)
     
@@ -303,22 +305,51 @@ def _align_ecc(
     
     criteria = (cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 
                 config.ecc_max_iterations, config.ecc_epsilon)
+    coarse_criteria = (cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT,
+                       config.ecc_pyramid_max_iterations, config.ecc_pyramid_epsilon)
+    
+    # Coarse-to-fine: most of the motion is found on small pyrDown levels,
+    # so full resolution only has to refine an almost-converged warp
+    pyramid = [(golden_gray.astype(np.float32), test_gray.astype(np.float32))]
+    for _ in range(config.ecc_pyramid_levels):
+        g, t = pyramid[-1]
+        if min(g.shape[:2]) < 128:
+            break
+        pyramid.append((cv2.pyrDown(g), cv2.pyrDown(t)))
+    
+    for g, t in reversed(pyramid[1:]):
+        try:
+            _, warp_matrix = cv2.findTransformECC(g, t, warp_matrix, warp_mode, coarse_criteria)
+        except cv2.error:
+            pass  # Keep the current estimate; finer levels may still converge
+        warp_matrix = _upscale_warp(warp_matrix)
+    if len(pyramid) > 1:
+        # Seeded at the optimum, ECC rarely meets ecc_epsilon; cap the refinement
+        criteria = (cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT,
+                    min(config.ecc_max_iterations, config.ecc_pyramid_max_iterations),
+                    config.ecc_epsilon)
     
     try:
         cc, warp_matrix = cv2.findTransformECC(
-            golden_gray.astype(np.float32),
-            test_gray.astype(np.float32),
+            pyramid[0][0], pyramid[0][1],
             warp_matrix, warp_mode, criteria
         )
         
-        if warp_mode == cv2.MOTION_HOMOGRAPHY:
-            aligned = cv2.warpPerspective(test, warp_matrix, (w, h))
-            valid_mask = cv2.warpPerspective(full_mask, warp_matrix, (w, h), borderValue=0)
-            dx, dy = warp_matrix[0, 2], warp_matrix[1, 2]
+        # ECC's warp maps golden coordinates into the test image, i.e. it is
+        # already the inverse map warpAffine/warpPerspective would compute
+        flags = cv2.INTER_LINEAR | cv2.WARP_INVERSE_MAP
+        dx, dy = warp_matrix[0, 2], warp_matrix[1, 2]
+        shift = _integer_shift(dx, dy) if warp_mode == cv2.MOTION_TRANSLATION else None
+        if shift is not None:
+            aligned, valid_mask = _translate(test, *shift)
+        elif warp_mode == cv2.MOTION_HOMOGRAPHY:
+            aligned = cv2.warpPerspective(test, warp_matrix, (w, h), flags=flags)
+            valid_mask = cv2.warpPerspective(full_mask, warp_matrix, (w, h), flags=flags,
+                                             borderValue=0)
         else:
-            aligned = cv2.warpAffine(test, warp_matrix, (w, h))
-            valid_mask = cv2.warpAffine(full_mask, warp_matrix, (w, h), borderValue=0)
-            dx, dy = warp_matrix[0, 2], warp_matrix[1, 2]
+            aligned = cv2.warpAffine(test, warp_matrix, (w, h), flags=flags)
+            valid_mask = cv2.warpAffine(full_mask, warp_matrix, (w, h), flags=flags,
+                                        borderValue=0)
         
         return aligned, (float(dx), float(dy)), float(cc), valid_mask
         
@@ -326,6 +357,44 @@ def _align_ecc(
         return test, (0.0, 0.0), 0.0, full_mask
 
 
+def _integer_shift(dx: float, dy: float) -> Optional[Tuple[int, int]]:
+    """(dx, dy) as whole pixels if bilinear warping would not interpolate.
+    
+    warpAffine quantizes sub-pixel positions to 1/32 px, so a shift within
+    1/128 px of an integer gives the same output as moving whole pixels.
+    """
+    ix, iy = round(dx), round(dy)
+    if abs(dx - ix) < 1 / 128 and abs(dy - iy) < 1 / 128:
+        return int(ix), int(iy)
+    return None
+
+
+def _translate(image: np.ndarray, ix: int, iy: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Whole-pixel shift ``out[y, x] = image[y + iy, x + ix]`` with a zero border.
+    
+    Returns the shifted image and its valid mask (255 where covered), the
+    same results as the equivalent warpAffine pair, using slice copies.
+    """
+    h, w = image.shape[:2]
+    shifted = np.zeros_like(image)
+    valid_mask = np.zeros((h, w), dtype=np.uint8)
+    if abs(ix) < w and abs(iy) < h:
+        dst = (slice(max(0, -iy), h - max(0, iy)), slice(max(0, -ix), w - max(0, ix)))
+        src = (slice(max(0, iy), h - max(0, -iy)), slice(max(0, ix), w - max(0, -ix)))
+        shifted[dst] = image[src]
+        valid_mask[dst] = 255
+    return shifted, valid_mask
+
+
+def _upscale_warp(warp_matrix: np.ndarray) -> np.ndarray:
+    """Map a warp estimated at one pyramid level to the next finer (2x) level."""
+    warp = warp_matrix.copy()
+    warp[:2, 2] *= 2
+    if warp.shape[0] == 3:  # Homography perspective terms scale the other way
+        warp[2, :2] /= 2
+    return warp
+
+
 def align_images_detailed(
     golden_image: np.ndarray,
     test_image: np.ndarray,
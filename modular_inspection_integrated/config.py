@@ -66,6 +66,7 @@ class LightSensitivityConfig:
     gold_value_low: int = 80        # Minimum brightness
     gold_value_high: int = 255      # Maximum brightness
     gold_enhance_contrast: bool = True  # Apply CLAHE to enhance gold regions
+    gold_mask_scale: float = 0.5    # Resolution the gold mask is computed at (1.0 = full)
 
 
 @dataclass
@@ -99,6 +100,13 @@ class AlignmentConfig:
     ecc_max_iterations: int = 5000
     ecc_epsilon: float = 1e-10
     ecc_motion_type: str = "euclidean"
+    ecc_pyramid_levels: int = 0         # pyrDown levels solved coarse-to-fine (0 = full res only)
+    # With a pyramid, coarse levels only seed the next one and stop at this
+    # loose criterion. The full-res pass keeps ecc_epsilon but is capped at
+    # ecc_pyramid_max_iterations: from a converged seed the correlation
+    # oscillates below 1e-10 and would otherwise run all ecc_max_iterations.
+    ecc_pyramid_max_iterations: int = 100
+    ecc_pyramid_epsilon: float = 1e-4
     
     # RANSAC
     ransac_reproj_threshold: float = 5.0
@@ -143,6 +151,8 @@ class SSIMConfig:
     
     pass_threshold: float = 0.975
     enabled: bool = True
+    scale: float = 1.0  # <1.0 = fast mode: SSIM on a downscaled pair (approximate score)
+    use_opencl: bool = False  # Run the SSIM map through OpenCV's T-API when OpenCL is available
 
 
 @dataclass
@@ -167,6 +177,7 @@ class GridAnalyzerConfig:
     count_threshold: int = 1000
     ssim_threshold: float = 0.975
     min_anomaly_segments: int = 2  # Segments with anomaly to flag whole image
+    max_workers: int = 0  # Threads for segment analysis (0 = one per core, 1 = serial)
 
 
 @dataclass
@@ -3,8 +3,10 @@
 Divides images into 3x3 grid and compares corresponding segments
 using SSIM and pixel matching for detailed anomaly detection.
 """
+import os
 import cv2
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple
 
 from .align import align_images
@@ -30,6 +32,7 @@ class GridAnalyzer:
         self.count_threshold = config.count_threshold
         self.ssim_threshold = config.ssim_threshold
         self.min_anomaly_segments = config.min_anomaly_segments
+        self.max_workers = config.max_workers
 
     def divide_image(self, image: np.ndarray) -> List[np.ndarray]:
         """Divide image into grid segments.
@@ -131,7 +134,8 @@ class GridAnalyzer:
             result['verdict'] = pixel_result['verdict']
             result['confidence'] = pixel_result.get('confidence', pixel_result['area_score'] / 100.0)
 
-        except Exception as e:
+        except (cv2.error, ValueError) as e:
+            # e.g. segment too small for SSIM's window or for alignment
             result['error'] = str(e)
 
         return result
@@ -160,10 +164,19 @@ class GridAnalyzer:
         total_confidence = 0.0
         num_segments = self.grid_size * self.grid_size
 
-        for idx in range(num_segments):
-            segment_result = self.analyze_segment_pair(
-                golden_segments[idx], test_segments[idx]
-            )
+        # Segments are independent and the OpenCV work releases the GIL,
+        # so analyze them on a thread pool
+        workers = self.max_workers or os.cpu_count() or 1
+        workers = min(workers, num_segments)
+        if workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as ex:
+                pair_results = list(ex.map(self.analyze_segment_pair,
+                                           golden_segments, test_segments))
+        else:
+            pair_results = [self.analyze_segment_pair(g, t)
+                            for g, t in zip(golden_segments, test_segments)]
+
+        for idx, segment_result in enumerate(pair_results):
             segment_result['segment_index'] = idx
             segment_results.append(segment_result)
 
@@ -8,18 +8,25 @@ import numpy as np
 import os
 import sys
 import time
+import threading
+import weakref
 import csv
 import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from PIL import Image, ImageTk
 from inference_sdk import InferenceHTTPClient
 
 # Import from integrated package
-from .io import read_image
+from .io import read_image, write_encoded
 from .align import align_images, AlignmentMethod
 from .ssim import calc_ssim
 from .pixel_match import run_pixel_matching
 from .edge_detection import run_edge_detection
-from .illumination import apply_light_sensitivity_mode, preprocess_pair, gold_pad_hsv_filter
+from .qr_cropper import QRCodeExtractor
+from .illumination import (
+    apply_light_sensitivity_mode, preprocess_pair, gold_pad_hsv_filter, close_open_mask
+)
 from .config import (
     LightSensitivityMode, LightSensitivityConfig,
     AlignmentConfig, get_default_config, InspectionMode
@@ -27,6 +34,339 @@ from .config import (
 from .theme import DARK_THEME
 
 
+# ==============================================================================
+# DISPLAY HELPERS
+# ==============================================================================
+
+# Resize targets reused between previews, keyed by output shape and dtype.
+# Only touched from the Tk thread.
+_display_buffers = {}
+_MAX_DISPLAY_BUFFERS = 16
+
+
+def _resize_for_display(image, size, interpolation=cv2.INTER_LINEAR):
+    """Resize an image to fit inside ``size`` for on-screen preview.
+
+    Large downscales are first halved with pyrDown (a fixed 5-tap Gaussian,
+    far cheaper than INTER_AREA at big ratios) until within 2x of the
+    target; the last step is INTER_LINEAR. With INTER_NEAREST (live
+    previews of binary masks) the image is sampled directly instead, a
+    plain gather with no filtering. A 4-channel image is previewed
+    without alpha.
+
+    The result lives in a shared buffer that the next call of the same
+    shape overwrites, so convert it (e.g. with _to_photo) before reuse.
+    An image that already has the fitted size is returned as is.
+
+    Returns:
+        Tuple of (resized image or None if it scales to nothing, ratio)
+    """
+    h, w = image.shape[:2]
+    # Exact integer fit: the float product int(w * (size[0] / w)) can land
+    # one pixel short of the target
+    num, den = (size[0], w) if size[0] * h <= size[1] * w else (size[1], h)
+    ratio = num / den
+    new_w, new_h = w * num // den, h * num // den
+    if new_w <= 0 or new_h <= 0:
+        return None, ratio
+    if (new_w, new_h) == (w, h):
+        return (image[:, :, :3] if image.ndim == 3 and image.shape[2] == 4 else image), ratio
+
+    if image.ndim == 3 and image.shape[2] == 4:
+        image = image[:, :, :3]
+    while (interpolation != cv2.INTER_NEAREST
+           and image.shape[0] >= 2 * new_h and image.shape[1] >= 2 * new_w):
+        image = cv2.pyrDown(image)
+    
+    out_shape = (new_h, new_w) + image.shape[2:]
+    key = (out_shape, image.dtype.str)
+    dst = _display_buffers.get(key)
+    if dst is None:
+        if len(_display_buffers) >= _MAX_DISPLAY_BUFFERS:
+            _display_buffers.clear()
+        dst = _display_buffers[key] = np.empty(out_shape, image.dtype)
+    return cv2.resize(image, (new_w, new_h), dst=dst, interpolation=interpolation), ratio
+
+
+def _to_photo(image, is_rgb=False):
+    """Wrap a BGR (or RGB/gray) array in a PhotoImage.
+
+    uint8 pixels are read straight from the array's buffer with
+    Image.frombuffer, and PIL's 'BGR' raw mode does the channel swap while
+    unpacking. That avoids both a cvtColor pass and the tobytes() copy
+    fromarray makes of a strided view. Grayscale goes through as an 'L'
+    image with no channel expansion.
+    """
+    if image.dtype != np.uint8:
+        if image.ndim == 3 and not is_rgb:
+            image = image[..., ::-1]
+        return ImageTk.PhotoImage(image=Image.fromarray(image))
+    if image.ndim == 3 and image.shape[2] == 4:
+        image = image[:, :, :3]
+    image = np.ascontiguousarray(image)
+    if image.ndim == 2:
+        mode = raw_mode = "L"
+    else:
+        mode, raw_mode = "RGB", ("RGB" if is_rgb else "BGR")
+    size = (image.shape[1], image.shape[0])
+    return ImageTk.PhotoImage(image=Image.frombuffer(mode, size, image, "raw", raw_mode, 0, 1))
+
+
+def _blit_to_canvas(canvas, photo, x, y, anchor=tk.NW):
+    """Show ``photo`` on ``canvas``, reusing one image item across redraws.
+
+    Re-pointing the existing item is cheaper than deleting and recreating
+    everything on the canvas, and overlays kept above it (the crosshair)
+    survive the redraw.
+    """
+    if getattr(canvas, "image", None) is photo:
+        return  # Same cached photo means same size and position: nothing to do
+    if canvas.find_withtag("image"):
+        canvas.coords("image", x, y)
+        canvas.itemconfigure("image", image=photo, anchor=anchor)
+    else:
+        canvas.create_image(x, y, anchor=anchor, image=photo, tags="image")
+        canvas.tag_lower("image")
+    canvas.image = photo  # Keep reference
+
+
+def _bind_wheel_while_hovered(canvas, handler):
+    """Route ``<MouseWheel>`` to ``handler`` only while the pointer is over ``canvas``.
+
+    A permanent ``bind_all`` sends every wheel event in the application
+    through one handler, and the last window to bind it steals scrolling
+    from the others. Binding on ``<Enter>`` and releasing on ``<Leave>``
+    keeps wheel events over the canvas's embedded widgets working too.
+    """
+    path = str(canvas)
+
+    def enter(_event):
+        canvas.bind_all("<MouseWheel>", handler)
+
+    def leave(event):
+        # Moving onto a widget embedded in the canvas also fires <Leave>
+        try:
+            inside = str(canvas.winfo_containing(event.x_root, event.y_root))
+        except (KeyError, tk.TclError):
+            inside = ""
+        if inside != path and not inside.startswith(path + "."):
+            canvas.unbind_all("<MouseWheel>")
+
+    canvas.bind("<Enter>", enter, add="+")
+    canvas.bind("<Leave>", leave, add="+")
+
+
+def _thumbnail_photo(image, max_size):
+    """PhotoImage thumbnail of a BGR uint8 image, fitted inside ``max_size``.
+
+    PIL reads the BGR buffer directly and Image.thumbnail shrinks it in
+    place (pre-reducing by whole factors first on big ratios), so there is
+    no cv2 resize/convert round-trip. Images already inside ``max_size``
+    are shown as is rather than enlarged.
+    """
+    if image.ndim == 3 and image.shape[2] == 4:
+        image = image[:, :, :3]
+    image = np.ascontiguousarray(image)
+    size = (image.shape[1], image.shape[0])
+    pil = Image.frombuffer("RGB", size, image, "raw", "BGR", 0, 1)
+    pil.thumbnail(max_size, Image.Resampling.BILINEAR)
+    return ImageTk.PhotoImage(image=pil)
+
+
+# PhotoImages of recently shown arrays:
+# {(id, shape, size, is_rgb, interpolation): (weakref to array, photo, ratio)}
+_photo_cache = {}
+_MAX_PHOTO_CACHE = 32
+# Keys whose source array has died. Filled by weakref callbacks, which may
+# fire on any thread, and drained on the Tk thread so that PhotoImages are
+# only ever deleted there.
+_dead_photo_keys = []
+
+
+def _photo_for(image, size, is_rgb=False, interpolation=cv2.INTER_LINEAR):
+    """Return a preview PhotoImage of ``image`` fitted into ``size``.
+
+    Redrawing the same array at the same size (slider moves, window
+    switches) reuses the cached PhotoImage instead of resizing and copying
+    it into Tk again. Entries hold only a weakref to the array, so a dead
+    array or a recycled id() never hits. Arrays must not be modified in
+    place once displayed; pass a new array when the content changes.
+    Entries for arrays that have been freed (e.g. the previous image after
+    a new load) are dropped on the next call.
+
+    Returns:
+        Tuple of (PhotoImage or None if it scales to nothing, ratio)
+    """
+    while _dead_photo_keys:
+        dead = _dead_photo_keys.pop()
+        entry = _photo_cache.get(dead)
+        if entry is not None and entry[0]() is None:
+            del _photo_cache[dead]
+
+    key = (id(image), image.shape, tuple(size), is_rgb, interpolation)
+    hit = _photo_cache.get(key)
+    if hit is not None and hit[0]() is image:
+        return hit[1], hit[2]
+
+    img_resized, ratio = _resize_for_display(image, size, interpolation)
+    if img_resized is None:
+        return None, ratio
+    photo = _to_photo(img_resized, is_rgb=is_rgb)
+
+    if len(_photo_cache) >= _MAX_PHOTO_CACHE:
+        _photo_cache.clear()
+    _photo_cache[key] = (weakref.ref(image, lambda _ref, k=key: _dead_photo_keys.append(k)),
+                         photo, ratio)
+    return photo, ratio
+
+
+# ==============================================================================
+# MORPHOLOGY KERNELS
+# ==============================================================================
+
+# Structuring elements are constants: build them once, not per call
+_K3_RECT = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
+_K5_ELLIPSE = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
+
+
+@lru_cache(maxsize=32)
+def _disk_kernel(radius):
+    """Ellipse of size 2r+1 (MATLAB strel('disk', r)), cached per radius."""
+    return cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (2 * radius + 1, 2 * radius + 1))
+
+
+# ==============================================================================
+# DETECTION HELPERS
+# ==============================================================================
+
+@lru_cache(maxsize=64)
+def _disk_stencil(radius):
+    """Filled 255-valued disc of side 2r+1, as cv2.circle draws it; read-only."""
+    stencil = np.zeros((2 * radius + 1, 2 * radius + 1), dtype=np.uint8)
+    cv2.circle(stencil, (radius, radius), radius, 255, -1)
+    stencil.setflags(write=False)
+    return stencil
+
+
+def _disk_mask(shape, cx, cy, radius):
+    """Zero mask of ``shape`` with a filled disc at (cx, cy), clipped to the mask.
+    
+    Pads come in few distinct radii, so the disc is pasted from a cached
+    stencil instead of being rasterised again for every pad.
+    """
+    mask = np.zeros(shape, dtype=np.uint8)
+    stencil = _disk_stencil(radius)
+    size = 2 * radius + 1
+    x0, y0 = cx - radius, cy - radius
+    sx, sy = max(0, -x0), max(0, -y0)
+    ex, ey = min(size, shape[1] - x0), min(size, shape[0] - y0)
+    if ex > sx and ey > sy:
+        mask[y0 + sy:y0 + ey, x0 + sx:x0 + ex] = stencil[sy:ey, sx:ex]
+    return mask
+
+
+def _find_circular_blobs(mask, min_r, max_r, min_circularity, min_area=100):
+    """Find roughly circular blobs in a binary mask.
+    
+    connectedComponentsWithStats measures every blob in one call, and its
+    bounding boxes bound the enclosing-circle radius from both sides
+    (max(w, h)/2 <= r <= hypot(w, h)/2), so most blobs are rejected in
+    NumPy. Only the survivors get a contour for the exact area, radius
+    and circularity checks.
+    
+    Returns:
+        List of dicts with center, radius, area, circularity and contour,
+        in no particular order
+    """
+    _, labels, stats, _ = cv2.connectedComponentsWithStats(mask, connectivity=8)
+    stats = stats[1:]
+    bw = stats[:, cv2.CC_STAT_WIDTH]
+    bh = stats[:, cv2.CC_STAT_HEIGHT]
+    # Pixel count is never below the contour area, so this is a safe pre-filter
+    keep = ((stats[:, cv2.CC_STAT_AREA] >= min_area)
+            & (0.5 * np.maximum(bw, bh) <= max_r)
+            & (0.5 * np.hypot(bw, bh) >= min_r))
+    
+    circles = []
+    for idx in np.flatnonzero(keep):
+        x, y, w, h = stats[idx, :4]
+        blob = (labels[y:y + h, x:x + w] == idx + 1).astype(np.uint8)
+        contours, _ = cv2.findContours(blob, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE,
+                                       offset=(int(x), int(y)))
+        contour = contours[0]
+        
+        area = cv2.contourArea(contour)
+        if area < min_area:
+            continue
+        
+        (cx, cy), radius = cv2.minEnclosingCircle(contour)
+        if not min_r <= radius <= max_r:
+            continue
+        
+        perimeter = cv2.arcLength(contour, True)
+        if perimeter <= 0:
+            continue
+        circularity = 4 * np.pi * area / (perimeter * perimeter)
+        if circularity >= min_circularity:
+            circles.append({
+                'center': (int(cx), int(cy)),
+                'radius': int(radius),
+                'area': area,
+                'circularity': circularity,
+                'contour': contour
+            })
+    
+    return circles
+
+
+def _sort_reading_order(circles, row_height=50):
+    """Order pads top-left to bottom-right, in bands of ``row_height`` px.
+    
+    np.lexsort is stable like list.sort, so ties keep their order, but the
+    comparison runs in C instead of calling a key lambda per pad.
+    """
+    if len(circles) < 2:
+        return circles
+    centers = np.array([c['center'] for c in circles])
+    order = np.lexsort((centers[:, 0], centers[:, 1] // row_height))
+    return [circles[i] for i in order.tolist()]
+
+
+# ==============================================================================
+# FILE HELPERS
+# ==============================================================================
+
+# 0/255 masks as 1-bit PNGs: an eighth of the bytes to deflate and store,
+# and they still decode to 0/255 uint8
+_BW_PNG_WRITE_PARAMS = [cv2.IMWRITE_PNG_BILEVEL, 1, cv2.IMWRITE_PNG_COMPRESSION, 1]
+
+
+def _write_pad_summary(path, title, settings, pads):
+    """Write a pad extraction summary: title, settings lines, one line per pad.
+
+    The text is assembled in memory and written with a single call.
+    """
+    lines = [title, "=" * 40, "", f"Total pads extracted: {len(pads)}", *settings, ""]
+    lines += [f"Pad #{pad['id']}: Center ({pad['center'][0]}, {pad['center'][1]}), R={pad['radius']}px"
+              for pad in pads]
+    with open(path, 'w') as f:
+        f.write("\n".join(lines) + "\n")
+
+
+def _write_pngs(jobs, max_workers=None):
+    """Write (path, image) pairs as PNGs concurrently.
+
+    PNG deflate dominates save time and OpenCV releases the GIL while
+    encoding, so one worker per core scales with the core count.
+    Raises IOError naming the first file that could not be written.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count() or 4) as ex:
+        futures = [(path, ex.submit(write_encoded, path, img)) for path, img in jobs]
+        for path, fut in futures:
+            if not fut.result():
+                raise IOError(f"Failed to write {path}")
+
+
 # ==============================================================================
 # ANOMALY LOCATION MAPPER
 # ==============================================================================
@@ -95,6 +435,14 @@ class ToolTip(object):
 # QR CODE CROPPER WINDOW
 # ==============================================================================
 
+def _preload_pyzbar():
+    """Import pyzbar (and load its zbar shared library) ahead of first use."""
+    try:
+        import pyzbar.pyzbar  # noqa: F401
+    except ImportError:
+        pass  # detect_and_decode falls back to OpenCV
+
+
 class QRCropperWindow(tk.Toplevel):
     """QR Code Detection and Cropping Window."""
     
@@ -102,6 +450,14 @@ class QRCropperWindow(tk.Toplevel):
     FG_COLOR = "#00FF41"
     ACCENT_COLOR = "#00FF41"
     FONT_FACE = "Consolas"
+    # Longer side that "Fast detect" scans at; coordinates map back to full res
+    DETECT_MAX_DIM = 1024
+    # One detected code in the results panel; filled straight from the result dict
+    RESULT_TEMPLATE = ("═══ QR #{id} ═══\n"
+                       "Data: {data}\n"
+                       "Position: {center}\n"
+                       "Size: {bbox[2]}x{bbox[3]}\n"
+                       "Method: {method}\n\n")
     
     def __init__(self, parent):
         super().__init__(parent)
@@ -111,12 +467,17 @@ class QRCropperWindow(tk.Toplevel):
         self.geometry("1000x700")
         self.configure(bg=self.BG_COLOR)
         
-        # Import QR extractor
-        from .qr_cropper import QRCodeExtractor
         self.extractor = QRCodeExtractor()
         
         self.current_image = None
         self.last_results = []
+        self.fast_detect = tk.BooleanVar(value=True)
+        # Detection/saving run here so the window keeps repainting; one
+        # worker also keeps the extractor's state single-threaded
+        self._pool = ThreadPoolExecutor(max_workers=1)
+        # Load the zbar library while the user is still picking an image;
+        # the single worker runs this before any detection
+        self._pool.submit(_preload_pyzbar)
         
         self._build_menu()
         self._build_ui()
@@ -154,6 +515,11 @@ class QRCropperWindow(tk.Toplevel):
             self.parent.lift()
             self.parent.focus_force()
     
+    def destroy(self):
+        """Stop the QR worker along with the window."""
+        self._pool.shutdown(wait=False)
+        super().destroy()
+    
     def _build_ui(self):
         """Build the QR Cropper UI."""
         # Main container
@@ -190,17 +556,24 @@ class QRCropperWindow(tk.Toplevel):
         
         ttk.Label(action_frame, text="< ACTIONS >").pack(pady=5)
         
-        detect_btn = tk.Button(action_frame, text="▶ DETECT QR CODES",
-                              font=(self.FONT_FACE, 11, 'bold'),
-                              bg="#004400", fg=self.FG_COLOR,
-                              command=self._detect_qr)
-        detect_btn.pack(fill=tk.X, padx=5, pady=5)
+        self.detect_btn = tk.Button(action_frame, text="▶ DETECT QR CODES",
+                                    font=(self.FONT_FACE, 11, 'bold'),
+                                    bg="#004400", fg=self.FG_COLOR,
+                                    command=self._detect_qr)
+        self.detect_btn.pack(fill=tk.X, padx=5, pady=5)
         
-        extract_btn = tk.Button(action_frame, text="📁 EXTRACT & SAVE",
-                               font=(self.FONT_FACE, 11, 'bold'),
-                               bg="#440044", fg="#FF88FF",
-                               command=self._extract_and_save)
-        extract_btn.pack(fill=tk.X, padx=5, pady=5)
+        self.extract_btn = tk.Button(action_frame, text="📁 EXTRACT & SAVE",
+                                     font=(self.FONT_FACE, 11, 'bold'),
+                                     bg="#440044", fg="#FF88FF",
+                                     command=self._extract_and_save)
+        self.extract_btn.pack(fill=tk.X, padx=5, pady=5)
+        
+        ttk.Checkbutton(action_frame, text="Fast detect (downscaled)",
+                        variable=self.fast_detect).pack(anchor=tk.W, padx=5, pady=2)
+        
+        # Animated by Tk's own timer while a job is on the worker
+        self.progress = ttk.Progressbar(action_frame, mode="indeterminate")
+        self.progress.pack(fill=tk.X, padx=5, pady=2)
         
         # Output folder
         folder_frame = tk.Frame(action_frame, bg=self.BG_COLOR)
@@ -215,6 +588,12 @@ class QRCropperWindow(tk.Toplevel):
         ttk.Button(folder_frame, text="Browse...",
                   command=self._browse_folder).pack(fill=tk.X, pady=2)
         
+        ttk.Label(folder_frame, text="Format:").pack(anchor=tk.W)
+        # JPEG encodes several times faster than PNG and crops carry no alpha
+        self.output_format_var = tk.StringVar(value="JPEG")
+        ttk.Combobox(folder_frame, textvariable=self.output_format_var,
+                     values=["JPEG", "PNG"], state="readonly").pack(fill=tk.X, pady=2)
+        
         # Results display
         results_frame = tk.Frame(controls_frame, bg=self.BG_COLOR,
                                 highlightbackground=self.FG_COLOR, highlightthickness=1)
@@ -252,6 +631,7 @@ class QRCropperWindow(tk.Toplevel):
             try:
                 from .io import read_image
                 self.current_image = read_image(path)
+                self.last_results = []  # Results belong to the previous image
                 self.image_status.config(text=os.path.basename(path), 
                                         foreground=self.FG_COLOR)
                 self._display_image(self.current_image)
@@ -261,49 +641,86 @@ class QRCropperWindow(tk.Toplevel):
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load image: {e}")
     
-    def _detect_qr(self):
-        """Detect QR codes in loaded image."""
+    def _set_busy(self, busy):
+        """Lock the action buttons while a job is on the worker."""
+        state = tk.DISABLED if busy else tk.NORMAL
+        self.detect_btn.config(state=state)
+        self.extract_btn.config(state=state)
+        if busy:
+            self.progress.start(50)
+        else:
+            self.progress.stop()
+    
+    def _post(self, callback, *args):
+        """Run ``callback(*args)`` on the Tk thread (worker side)."""
+        try:
+            self.after(0, callback, *args)
+        except (RuntimeError, tk.TclError):
+            pass  # Window closed while the worker ran
+    
+    def _apply_detect_options(self):
+        """Push the Fast detect setting to the extractor before a job."""
+        self.extractor.detect_max_dim = self.DETECT_MAX_DIM if self.fast_detect.get() else None
+    
+    def _detect_qr(self, on_done=None):
+        """Detect QR codes in loaded image on the worker.
+        
+        ``on_done`` is called on the Tk thread once the results are shown.
+        """
         if self.current_image is None:
             messagebox.showwarning("No Image", "Please load an image first.")
             return
         
         self.status_var.set("Detecting QR codes...")
-        self.update_idletasks()
+        self._set_busy(True)
+        self._apply_detect_options()
+        
+        image = self.current_image
+        future = self._pool.submit(self._detect_worker, image)
+        future.add_done_callback(lambda f: self._post(self._on_detect_done, image, f, on_done))
+    
+    def _detect_worker(self, image):
+        """Detect and annotate QR codes. No Tk calls."""
+        results = self.extractor.detect_and_decode(image)
+        return results, self.extractor.annotate_image(image, results)
+    
+    def _on_detect_done(self, image, future, on_done):
+        """Show finished detection results unless another image was loaded since."""
+        self._set_busy(False)
+        if image is not self.current_image:
+            return
         
         try:
-            results = self.extractor.detect_and_decode(self.current_image)
+            results, annotated = future.result()
             self.last_results = results
             
             # Display annotated image
-            annotated = self.extractor.annotate_image(self.current_image)
             self._display_image(annotated)
             
-            # Show results
-            self.results_text.delete(1.0, tk.END)
-            
+            # Show results: built as one string so Tk gets a single insert
             if not results:
-                self.results_text.insert(tk.END, "No QR codes detected.\n\n")
-                self.results_text.insert(tk.END, "Tips:\n")
-                self.results_text.insert(tk.END, "- Ensure QR code is clearly visible\n")
-                self.results_text.insert(tk.END, "- Try improving lighting/contrast\n")
-                self.results_text.insert(tk.END, "- QR code should not be rotated >45°\n")
+                text = ("No QR codes detected.\n\n"
+                        "Tips:\n"
+                        "- Ensure QR code is clearly visible\n"
+                        "- Try improving lighting/contrast\n"
+                        "- QR code should not be rotated >45°\n")
                 self.status_var.set("No QR codes found")
             else:
-                self.results_text.insert(tk.END, f"Found {len(results)} QR code(s):\n\n")
-                
-                for qr in results:
-                    self.results_text.insert(tk.END, f"═══ QR #{qr['id']} ═══\n")
-                    self.results_text.insert(tk.END, f"Data: {qr['data']}\n")
-                    self.results_text.insert(tk.END, f"Position: {qr['center']}\n")
-                    self.results_text.insert(tk.END, f"Size: {qr['bbox'][2]}x{qr['bbox'][3]}\n")
-                    self.results_text.insert(tk.END, f"Method: {qr['method']}\n\n")
-                
+                text = f"Found {len(results)} QR code(s):\n\n" + "".join(
+                    map(self.RESULT_TEMPLATE.format_map, results))
                 self.status_var.set(f"Found {len(results)} QR code(s)")
+            
+            self.results_text.delete(1.0, tk.END)
+            self.results_text.insert(tk.END, text)
                 
         except Exception as e:
             self.results_text.delete(1.0, tk.END)
             self.results_text.insert(tk.END, f"Error: {str(e)}")
             self.status_var.set(f"Error: {str(e)}")
+            return
+        
+        if on_done is not None:
+            on_done()
     
     def _extract_and_save(self):
         """Extract detected QR codes and save to folder."""
@@ -313,26 +730,39 @@ class QRCropperWindow(tk.Toplevel):
         
         if not self.last_results:
             # Try detecting first
-            self._detect_qr()
-            if not self.last_results:
-                messagebox.showinfo("No QR Codes", "No QR codes were detected to extract.")
-                return
+            self._detect_qr(on_done=self._save_detected)
+        else:
+            self._save_detected()
+    
+    def _save_detected(self):
+        """Save the detected QR codes on the worker."""
+        if not self.last_results:
+            messagebox.showinfo("No QR Codes", "No QR codes were detected to extract.")
+            return
         
         output_dir = self.output_folder_var.get()
         self.extractor.output_dir = output_dir
+        self.extractor.output_format = self.output_format_var.get()
         
         self.status_var.set(f"Saving QR codes to {output_dir}...")
-        self.update_idletasks()
+        self._set_busy(True)
+        self._apply_detect_options()
         
+        # Crop from the results already shown rather than detecting again
+        future = self._pool.submit(self.extractor.save_cropped_qr, self.current_image,
+                                   results=self.last_results)
+        future.add_done_callback(lambda f: self._post(self._on_save_done, output_dir, f))
+    
+    def _on_save_done(self, output_dir, future):
+        """Report the files written by _save_detected."""
+        self._set_busy(False)
         try:
-            saved_paths = self.extractor.save_cropped_qr(self.current_image)
+            saved_paths = future.result()
             
             if saved_paths:
-                self.results_text.insert(tk.END, "\n═══ SAVED FILES ═══\n")
-                for path in saved_paths:
-                    self.results_text.insert(tk.END, f"✓ {os.path.basename(path)}\n")
-                
-                self.results_text.insert(tk.END, f"\nSaved to: {os.path.abspath(output_dir)}\n")
+                self.results_text.insert(tk.END, "\n═══ SAVED FILES ═══\n"
+                    + "".join(f"✓ {os.path.basename(path)}\n" for path in saved_paths)
+                    + f"\nSaved to: {os.path.abspath(output_dir)}\n")
                 self.status_var.set(f"Saved {len(saved_paths)} QR code(s) to {output_dir}")
                 
                 messagebox.showinfo("Success", 
@@ -355,21 +785,10 @@ class QRCropperWindow(tk.Toplevel):
         if cv2_image is None or cv2_image.size == 0:
             return
         
-        h, w = cv2_image.shape[:2]
-        ratio = min(size[0]/w, size[1]/h)
-        new_w, new_h = int(w * ratio), int(h * ratio)
-        
-        if new_w == 0 or new_h == 0:
+        photo, _ = _photo_for(cv2_image, size)
+        if photo is None:
             return
         
-        img_resized = cv2.resize(cv2_image, (new_w, new_h), interpolation=cv2.INTER_AREA)
-        
-        if len(img_resized.shape) == 2:
-            img_resized = cv2.cvtColor(img_resized, cv2.COLOR_GRAY2BGR)
-        
-        img_rgb = cv2.cvtColor(img_resized, cv2.COLOR_BGR2RGB)
-        photo = ImageTk.PhotoImage(image=Image.fromarray(img_rgb))
-        
         self.image_label.config(image=photo)
         self.image_label.image = photo
 
@@ -398,6 +817,18 @@ class GoldPadExtractorWindow(tk.Toplevel):
         self.detected_pads = []
         self.extracted_pads = []
         self.preview_image = None
+        self.gallery_photos = []  # PhotoImages of the thumbnails on screen
+        
+        # (image, HSV of it) last built by _get_gold_mask; slider moves only
+        # change the thresholds, not the image. One tuple so the worker and
+        # the Tk thread can't leave a mismatched pair behind.
+        self._hsv_cache = (None, None)
+        
+        # Pending after() id of a debounced preview
+        self._preview_job = None
+        # Detection runs here so the window stays responsive; one worker
+        # keeps previews in submission order
+        self._pool = ThreadPoolExecutor(max_workers=1)
         
         # Default HSV range for gold (adjustable)
         self.hue_low = tk.IntVar(value=15)
@@ -411,6 +842,8 @@ class GoldPadExtractorWindow(tk.Toplevel):
         self.min_radius = tk.IntVar(value=20)
         self.max_radius = tk.IntVar(value=100)
         self.min_circularity = tk.DoubleVar(value=0.7)
+        self.use_hough = tk.BooleanVar(value=False)
+        self.fast_mask = tk.BooleanVar(value=False)
         
         self._build_menu()
         self._build_ui()
@@ -443,6 +876,11 @@ class GoldPadExtractorWindow(tk.Toplevel):
         """Close this tool window and return focus to main."""
         self.destroy()
     
+    def destroy(self):
+        """Stop the detection worker along with the window."""
+        self._pool.shutdown(wait=False)
+        super().destroy()
+    
     def _build_ui(self):
         """Build the Gold Pad Extractor UI."""
         # Main container
@@ -479,6 +917,10 @@ class GoldPadExtractorWindow(tk.Toplevel):
         
         ttk.Label(hsv_frame, text="< HSV GOLD FILTER >", foreground=self.ACCENT_COLOR).pack(pady=5)
         
+        ttk.Checkbutton(hsv_frame, text="Skip mask cleanup (fast)",
+                        variable=self.fast_mask,
+                        command=self._on_param_change).pack(anchor=tk.W, padx=5, pady=2)
+        
         # Hue range
         self._add_slider(hsv_frame, "Hue Low:", self.hue_low, 0, 179)
         self._add_slider(hsv_frame, "Hue High:", self.hue_high, 0, 179)
@@ -500,6 +942,9 @@ class GoldPadExtractorWindow(tk.Toplevel):
         
         self._add_slider(circle_frame, "Min Radius:", self.min_radius, 5, 200)
         self._add_slider(circle_frame, "Max Radius:", self.max_radius, 10, 300)
+        ttk.Checkbutton(circle_frame, text="Hough detection (fast, half-res)",
+                        variable=self.use_hough,
+                        command=self._on_param_change).pack(anchor=tk.W, padx=5, pady=2)
         
         # Action buttons
         action_frame = tk.Frame(controls_frame, bg=self.BG_COLOR)
@@ -568,11 +1013,17 @@ class GoldPadExtractorWindow(tk.Toplevel):
         row = tk.Frame(parent, bg=self.BG_COLOR)
         row.pack(fill=tk.X, padx=5, pady=2)
         ttk.Label(row, text=label, width=10).pack(side=tk.LEFT)
-        slider = ttk.Scale(row, from_=from_, to=to, variable=variable, orient=tk.HORIZONTAL)
+        slider = ttk.Scale(row, from_=from_, to=to, variable=variable, orient=tk.HORIZONTAL,
+                           command=self._on_param_change)
         slider.pack(side=tk.LEFT, fill=tk.X, expand=True)
         value_label = ttk.Label(row, textvariable=variable, width=4)
         value_label.pack(side=tk.LEFT)
     
+    def _on_param_change(self, *_):
+        """Live-preview detection while a setting is being tuned."""
+        if self.current_image is not None:
+            self._preview_detection()
+    
     def _load_image(self):
         """Load an image for gold pad extraction."""
         path = filedialog.askopenfilename(
@@ -583,6 +1034,9 @@ class GoldPadExtractorWindow(tk.Toplevel):
             try:
                 from .io import read_image
                 self.current_image = read_image(path)
+                self._hsv_cache = (None, None)
+                self.gallery_canvas.delete("all")
+                self.gallery_photos = []
                 self.image_status.config(text=os.path.basename(path), 
                                         foreground=self.FG_COLOR)
                 self._display_image(self.current_image, self.preview_label)
@@ -592,80 +1046,155 @@ class GoldPadExtractorWindow(tk.Toplevel):
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to load image: {e}")
     
-    def _get_gold_mask(self, image):
+    def _detection_params(self):
+        """Snapshot the detection settings so workers never touch Tk variables."""
+        return {
+            'lower': (self.hue_low.get(), self.sat_low.get(), self.val_low.get()),
+            'upper': (self.hue_high.get(), self.sat_high.get(), self.val_high.get()),
+            'min_radius': self.min_radius.get(),
+            'max_radius': self.max_radius.get(),
+            'min_circularity': self.min_circularity.get(),
+            'use_hough': self.use_hough.get(),
+            'fast_mask': self.fast_mask.get(),
+        }
+    
+    def _get_gold_mask(self, image, params):
         """Create HSV mask for gold regions."""
-        hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+        src, hsv = self._hsv_cache
+        if src is not image:
+            hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+            self._hsv_cache = (image, hsv)
         
-        lower = np.array([self.hue_low.get(), self.sat_low.get(), self.val_low.get()])
-        upper = np.array([self.hue_high.get(), self.sat_high.get(), self.val_high.get()])
+        mask = cv2.inRange(hsv, params['lower'], params['upper'])
         
-        mask = cv2.inRange(hsv, lower, upper)
-        
-        # Morphological cleanup
-        kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
-        mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel)
-        mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel)
+        # Morphological cleanup (clean inputs can do without it)
+        if not params['fast_mask']:
+            mask = close_open_mask(mask, 5)
         
         return mask
     
-    def _detect_circles(self, mask):
+    def _detect_circles(self, mask, params):
         """Detect circular gold pads from the mask."""
-        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
-        
-        circles = []
-        min_r = self.min_radius.get()
-        max_r = self.max_radius.get()
-        
-        for contour in contours:
-            area = cv2.contourArea(contour)
-            if area < 100:  # Skip very small contours
-                continue
-            
-            # Fit minimum enclosing circle
-            (x, y), radius = cv2.minEnclosingCircle(contour)
-            
-            if min_r <= radius <= max_r:
-                # Check circularity
-                perimeter = cv2.arcLength(contour, True)
-                if perimeter > 0:
-                    circularity = 4 * np.pi * area / (perimeter * perimeter)
-                    
-                    if circularity >= self.min_circularity.get():
-                        circles.append({
-                            'center': (int(x), int(y)),
-                            'radius': int(radius),
-                            'area': area,
-                            'circularity': circularity,
-                            'contour': contour
-                        })
+        circles = _find_circular_blobs(mask, params['min_radius'], params['max_radius'],
+                                       params['min_circularity'])
         
         # Sort by y then x (top-left to bottom-right)
-        circles.sort(key=lambda c: (c['center'][1] // 50, c['center'][0]))
+        circles = _sort_reading_order(circles)
         
         return circles
     
+    def _detect_circles_hough(self, image, params):
+        """Detect circular gold pads with HOUGH_GRADIENT_ALT at half resolution.
+        
+        CLAHE, blur and the detector run on a quarter of the pixels. The HSV
+        range only confirms each candidate circle, so no full-size mask or
+        morphology pass is needed.
+        
+        Returns:
+            Tuple of (half-size gold mask for the preview, list of pads)
+        """
+        small = cv2.resize(image, None, fx=0.5, fy=0.5, interpolation=cv2.INTER_AREA)
+        gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+        gray = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8)).apply(gray)
+        gray = cv2.GaussianBlur(gray, (7, 7), 1.5)
+        
+        min_r = params['min_radius']
+        max_r = params['max_radius']
+        found = cv2.HoughCircles(gray, cv2.HOUGH_GRADIENT_ALT, dp=1.5, minDist=50,
+                                 param1=300, param2=0.9,
+                                 minRadius=min_r // 2, maxRadius=max_r // 2)
+        
+        hsv = cv2.cvtColor(small, cv2.COLOR_BGR2HSV)
+        mask = cv2.inRange(hsv, params['lower'], params['upper'])
+        
+        circles = []
+        if found is not None:
+            sh, sw = mask.shape
+            for x, y, r in found[0]:
+                xi, yi, ri = int(round(x)), int(round(y)), max(1, int(round(r)))
+                x1, y1 = max(0, xi - ri), max(0, yi - ri)
+                x2, y2 = min(sw, xi + ri + 1), min(sh, yi + ri + 1)
+                
+                # Keep the circle only if most of its disc is gold-coloured
+                disc = _disk_mask((y2 - y1, x2 - x1), xi - x1, yi - y1, ri)
+                if cv2.mean(mask[y1:y2, x1:x2], mask=disc)[0] < 127.5:
+                    continue
+                
+                radius = int(r * 2)
+                circles.append({
+                    'center': (int(x * 2), int(y * 2)),
+                    'radius': radius,
+                    'area': np.pi * radius * radius,
+                    'circularity': 1.0,
+                    'contour': None
+                })
+        
+        circles = _sort_reading_order(circles)
+        
+        return mask, circles
+    
     def _preview_detection(self):
-        """Preview the gold mask and detected circles."""
+        """Schedule a preview; a burst of calls within 150 ms runs it once."""
+        if self._preview_job is not None:
+            self.after_cancel(self._preview_job)
+        self._preview_job = self.after(150, self._preview_detection_now)
+    
+    def _preview_detection_now(self):
+        """Start a preview of the gold mask and detected circles on the worker."""
+        self._preview_job = None
         if self.current_image is None:
             messagebox.showwarning("No Image", "Please load an image first.")
             return
         
         self.status_var.set("Detecting gold pads...")
-        self.update_idletasks()
         
-        # Get gold mask
-        mask = self._get_gold_mask(self.current_image)
+        image = self.current_image
+        future = self._pool.submit(self._compute_preview, image, self._detection_params())
+        future.add_done_callback(lambda f: self._post_preview(image, f))
+    
+    def _post_preview(self, image, future):
+        """Hand a finished preview back to the Tk thread (worker side)."""
+        try:
+            self.after(0, self._on_preview_done, image, future)
+        except (RuntimeError, tk.TclError):
+            pass  # Window closed while detecting
+    
+    def _on_preview_done(self, image, future):
+        """Show a finished preview unless a different image was loaded since."""
+        if image is not self.current_image:
+            return
+        try:
+            result = future.result()
+        except (cv2.error, ValueError) as e:
+            self.status_var.set(f"Detection error: {e}")
+            return
+        self._apply_preview(*result)
+    
+    def _compute_preview(self, image, params):
+        """Detect pads and build the mask/detection view. No Tk calls.
         
-        # Detect circles
-        self.detected_pads = self._detect_circles(mask)
+        Returns:
+            Tuple of (gold mask, detected pads, side-by-side preview image)
+        """
+        if params['use_hough']:
+            mask, pads = self._detect_circles_hough(image, params)
+        else:
+            # Get gold mask
+            mask = self._get_gold_mask(image, params)
+            
+            # Detect circles
+            pads = self._detect_circles(mask, params)
         
-        # Create preview image
-        preview = self.current_image.copy()
+        # Create the half-size preview first and draw on that: the overlay
+        # and the copy touch a quarter of the pixels
+        h, w = image.shape[:2]
+        half = (w // 2, h // 2)
+        preview = cv2.resize(image, half, interpolation=cv2.INTER_AREA)
         
         # Draw detected circles
-        for i, pad in enumerate(self.detected_pads):
-            cx, cy = pad['center']
-            r = pad['radius']
+        for i, pad in enumerate(pads):
+            cx, cy = pad['center'][0] // 2, pad['center'][1] // 2
+            r = pad['radius'] // 2
             
             # Draw circle outline
             cv2.circle(preview, (cx, cy), r, (0, 255, 0), 2)
@@ -678,16 +1207,18 @@ class GoldPadExtractorWindow(tk.Toplevel):
                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 1)
         
         # Create side-by-side view (mask + detection)
-        mask_colored = cv2.cvtColor(mask, cv2.COLOR_GRAY2BGR)
-        mask_colored[:, :, 1] = np.where(mask > 0, 200, 0)  # Green tint for gold
-        mask_colored[:, :, 0] = np.where(mask > 0, 50, 0)   # Blue tint
+        # Gold tint (B=50, G=200, R=255) in one masked write
+        mask_small = cv2.resize(mask, half, interpolation=cv2.INTER_NEAREST)
+        mask_colored = np.zeros(mask_small.shape + (3,), dtype=np.uint8)
+        mask_colored[mask_small > 0] = (50, 200, 255)
         
-        h, w = preview.shape[:2]
-        combined = np.hstack([
-            cv2.resize(mask_colored, (w//2, h//2)),
-            cv2.resize(preview, (w//2, h//2))
-        ])
+        combined = np.hstack([mask_colored, preview])
         
+        return mask, pads, combined
+    
+    def _apply_preview(self, mask, pads, combined):
+        """Publish a computed preview to the window."""
+        self.detected_pads = pads
         self._display_image(combined, self.preview_label, size=(800, 500))
         
         # Update results
@@ -709,8 +1240,9 @@ class GoldPadExtractorWindow(tk.Toplevel):
             return
         
         if not self.detected_pads:
-            # Run detection first
-            self._preview_detection()
+            # Run detection first (synchronously: extraction needs the result)
+            self._apply_preview(*self._compute_preview(self.current_image,
+                                                       self._detection_params()))
             if not self.detected_pads:
                 messagebox.showinfo("No Pads", "No gold pads detected. Adjust HSV settings.")
                 return
@@ -733,13 +1265,10 @@ class GoldPadExtractorWindow(tk.Toplevel):
             y2 = min(h, cy + r + padding)
             
             # Extract region
-            pad_image = self.current_image[y1:y2, x1:x2].copy()
+            pad_image = self.current_image[y1:y2, x1:x2]
             
             # Create circular mask
-            mask = np.zeros(pad_image.shape[:2], dtype=np.uint8)
-            local_cx = cx - x1
-            local_cy = cy - y1
-            cv2.circle(mask, (local_cx, local_cy), r, 255, -1)
+            mask = _disk_mask(pad_image.shape[:2], cx - x1, cy - y1, r)
             
             # Apply mask (transparent background)
             pad_masked = cv2.bitwise_and(pad_image, pad_image, mask=mask)
@@ -763,6 +1292,8 @@ class GoldPadExtractorWindow(tk.Toplevel):
     def _update_gallery(self):
         """Update the gallery canvas with extracted pads."""
         self.gallery_canvas.delete("all")
+        # Only the thumbnails drawn below need to stay referenced
+        self.gallery_photos = []
         
         if not self.extracted_pads:
             return
@@ -772,25 +1303,14 @@ class GoldPadExtractorWindow(tk.Toplevel):
         thumb_size = 80
         
         for pad in self.extracted_pads[:15]:  # Show first 15
-            img = pad['image']
-            
-            # Resize for thumbnail
-            h, w = img.shape[:2]
-            scale = min(thumb_size/w, thumb_size/h)
-            new_w, new_h = int(w*scale), int(h*scale)
-            
-            thumb = cv2.resize(img, (new_w, new_h))
-            thumb_rgb = cv2.cvtColor(thumb, cv2.COLOR_BGR2RGB)
-            
-            photo = ImageTk.PhotoImage(image=Image.fromarray(thumb_rgb))
+            photo = _thumbnail_photo(pad['image'], (thumb_size, thumb_size))
+            new_w, new_h = photo.width(), photo.height()
             
             self.gallery_canvas.create_image(x_offset, 10, anchor=tk.NW, image=photo)
             self.gallery_canvas.create_text(x_offset + new_w//2, new_h + 20, 
                                            text=f"#{pad['id']}", fill=self.FG_COLOR)
             
             # Keep reference
-            if not hasattr(self, 'gallery_photos'):
-                self.gallery_photos = []
             self.gallery_photos.append(photo)
             
             x_offset += new_w + 15
@@ -815,31 +1335,28 @@ class GoldPadExtractorWindow(tk.Toplevel):
             self.update_idletasks()
             
             saved_files = []
+            jobs = []
             
             for pad in self.extracted_pads:
                 # Save only masked version with transparency (RGBA)
                 filename = f"pad_{pad['id']:03d}.png"
                 filepath = os.path.join(pads_folder, filename)
                 
-                # Create RGBA image with transparency
-                b, g, r = cv2.split(pad['image'])
-                alpha = pad['mask']
-                rgba = cv2.merge([b, g, r, alpha])
-                cv2.imwrite(filepath, rgba)
+                # Create RGBA image with transparency (one interleaving pass)
+                rgba = np.dstack((pad['image'], pad['mask']))
+                jobs.append((filepath, rgba))
                 saved_files.append(filename)
             
+            _write_pngs(jobs)
+            
             # Save summary
-            summary_path = os.path.join(pads_folder, "extraction_summary.txt")
-            with open(summary_path, 'w') as f:
-                f.write("GOLD PAD EXTRACTION SUMMARY\n")
-                f.write("=" * 40 + "\n\n")
-                f.write(f"Total pads extracted: {len(self.extracted_pads)}\n")
-                f.write(f"HSV Range: H({self.hue_low.get()}-{self.hue_high.get()}), ")
-                f.write(f"S({self.sat_low.get()}-{self.sat_high.get()}), ")
-                f.write(f"V({self.val_low.get()}-{self.val_high.get()})\n\n")
-                
-                for pad in self.extracted_pads:
-                    f.write(f"Pad #{pad['id']}: Center ({pad['center'][0]}, {pad['center'][1]}), R={pad['radius']}px\n")
+            _write_pad_summary(
+                os.path.join(pads_folder, "extraction_summary.txt"),
+                "GOLD PAD EXTRACTION SUMMARY",
+                [f"HSV Range: H({self.hue_low.get()}-{self.hue_high.get()}), "
+                 f"S({self.sat_low.get()}-{self.sat_high.get()}), "
+                 f"V({self.val_low.get()}-{self.val_high.get()})"],
+                self.extracted_pads)
             
             self.status_var.set(f"Saved {len(saved_files)} pads to: {pads_folder}")
             messagebox.showinfo("Saved", 
@@ -857,21 +1374,10 @@ class GoldPadExtractorWindow(tk.Toplevel):
         if cv2_image is None or cv2_image.size == 0:
             return
         
-        h, w = cv2_image.shape[:2]
-        ratio = min(size[0]/w, size[1]/h)
-        new_w, new_h = int(w * ratio), int(h * ratio)
-        
-        if new_w == 0 or new_h == 0:
+        photo, _ = _photo_for(cv2_image, size)
+        if photo is None:
             return
         
-        img_resized = cv2.resize(cv2_image, (new_w, new_h), interpolation=cv2.INTER_AREA)
-        
-        if len(img_resized.shape) == 2:
-            img_resized = cv2.cvtColor(img_resized, cv2.COLOR_GRAY2BGR)
-        
-        img_rgb = cv2.cvtColor(img_resized, cv2.COLOR_BGR2RGB)
-        photo = ImageTk.PhotoImage(image=Image.fromarray(img_rgb))
-        
         label.config(image=photo)
         label.image = photo
 
@@ -904,6 +1410,7 @@ class RedPadExtractorWindow(tk.Toplevel):
         self.detected_pads = []
         self.extracted_pads = []
         self.preview_image = None
+        self.gallery_photos = []  # PhotoImages of the thumbnails on screen
         
         # Default HSV range for red (two ranges: 0-10 and 160-179)
         self.hue_low1 = tk.IntVar(value=0)
@@ -1097,6 +1604,8 @@ class RedPadExtractorWindow(tk.Toplevel):
             try:
                 from .io import read_image
                 self.current_image = read_image(path)
+                self.gallery_canvas.delete("all")
+                self.gallery_photos = []
                 self.image_status.config(text=os.path.basename(path), 
                                         foreground=self.FG_COLOR)
                 self._display_image(self.current_image, self.preview_label)
@@ -1111,55 +1620,29 @@ class RedPadExtractorWindow(tk.Toplevel):
         hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
         
         # Range 1: low reds (0-10)
-        lower1 = np.array([self.hue_low1.get(), self.sat_low.get(), self.val_low.get()])
-        upper1 = np.array([self.hue_high1.get(), self.sat_high.get(), self.val_high.get()])
+        lower1 = (self.hue_low1.get(), self.sat_low.get(), self.val_low.get())
+        upper1 = (self.hue_high1.get(), self.sat_high.get(), self.val_high.get())
         mask1 = cv2.inRange(hsv, lower1, upper1)
         
         # Range 2: high reds (160-179)
-        lower2 = np.array([self.hue_low2.get(), self.sat_low.get(), self.val_low.get()])
-        upper2 = np.array([self.hue_high2.get(), self.sat_high.get(), self.val_high.get()])
+        lower2 = (self.hue_low2.get(), self.sat_low.get(), self.val_low.get())
+        upper2 = (self.hue_high2.get(), self.sat_high.get(), self.val_high.get())
         mask2 = cv2.inRange(hsv, lower2, upper2)
         
         # Combine both ranges
-        mask = cv2.bitwise_or(mask1, mask2)
+        mask = cv2.bitwise_or(mask1, mask2, dst=mask1)
         
         # Morphological cleanup
-        kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
-        mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel)
-        mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel)
+        mask = close_open_mask(mask, 5)
         
         return mask
     
     def _detect_circles(self, mask):
         """Detect circular red pads from the mask."""
-        contours, _ = cv2.findContours(mask, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        circles = _find_circular_blobs(mask, self.min_radius.get(), self.max_radius.get(),
+                                       self.min_circularity.get())
         
-        circles = []
-        min_r = self.min_radius.get()
-        max_r = self.max_radius.get()
-        
-        for contour in contours:
-            area = cv2.contourArea(contour)
-            if area < 100:
-                continue
-            
-            (x, y), radius = cv2.minEnclosingCircle(contour)
-            
-            if min_r <= radius <= max_r:
-                perimeter = cv2.arcLength(contour, True)
-                if perimeter > 0:
-                    circularity = 4 * np.pi * area / (perimeter * perimeter)
-                    
-                    if circularity >= self.min_circularity.get():
-                        circles.append({
-                            'center': (int(x), int(y)),
-                            'radius': int(radius),
-                            'area': area,
-                            'circularity': circularity,
-                            'contour': contour
-                        })
-        
-        circles.sort(key=lambda c: (c['center'][1] // 50, c['center'][0]))
+        circles = _sort_reading_order(circles)
         return circles
     
     def _preview_detection(self):
@@ -1174,26 +1657,26 @@ class RedPadExtractorWindow(tk.Toplevel):
         mask = self._get_red_mask(self.current_image)
         self.detected_pads = self._detect_circles(mask)
         
-        preview = self.current_image.copy()
+        # Draw on the half-size preview rather than a full-size copy
+        h, w = self.current_image.shape[:2]
+        half = (w // 2, h // 2)
+        preview = cv2.resize(self.current_image, half, interpolation=cv2.INTER_AREA)
         
         for i, pad in enumerate(self.detected_pads):
-            cx, cy = pad['center']
-            r = pad['radius']
+            cx, cy = pad['center'][0] // 2, pad['center'][1] // 2
+            r = pad['radius'] // 2
             cv2.circle(preview, (cx, cy), r, (0, 255, 0), 2)
             cv2.circle(preview, (cx, cy), 3, (0, 255, 255), -1)
             cv2.putText(preview, str(i+1), (cx-10, cy-r-5),
                        cv2.FONT_HERSHEY_SIMPLEX, 0.5, (255, 255, 0), 1)
         
         # Side-by-side view
-        mask_colored = cv2.cvtColor(mask, cv2.COLOR_GRAY2BGR)
-        mask_colored[:, :, 2] = np.where(mask > 0, 200, 0)  # Red tint
-        mask_colored[:, :, 0] = np.where(mask > 0, 50, 0)
+        # Red tint (B=50, G=255, R=200) in one masked write
+        mask_small = cv2.resize(mask, half, interpolation=cv2.INTER_NEAREST)
+        mask_colored = np.zeros(mask_small.shape + (3,), dtype=np.uint8)
+        mask_colored[mask_small > 0] = (50, 255, 200)
         
-        h, w = preview.shape[:2]
-        combined = np.hstack([
-            cv2.resize(mask_colored, (w//2, h//2)),
-            cv2.resize(preview, (w//2, h//2))
-        ])
+        combined = np.hstack([mask_colored, preview])
         
         self._display_image(combined, self.preview_label, size=(800, 500))
         
@@ -1236,18 +1719,15 @@ class RedPadExtractorWindow(tk.Toplevel):
             x2 = min(w, cx + r + padding)
             y2 = min(h, cy + r + padding)
             
-            pad_image = self.current_image[y1:y2, x1:x2].copy()
+            pad_image = self.current_image[y1:y2, x1:x2]
             
-            mask = np.zeros(pad_image.shape[:2], dtype=np.uint8)
-            local_cx = cx - x1
-            local_cy = cy - y1
-            cv2.circle(mask, (local_cx, local_cy), r, 255, -1)
+            mask = _disk_mask(pad_image.shape[:2], cx - x1, cy - y1, r)
             
             pad_masked = cv2.bitwise_and(pad_image, pad_image, mask=mask)
             
-            white_bg = np.ones_like(pad_image) * 255
-            white_bg = cv2.bitwise_and(white_bg, white_bg, mask=cv2.bitwise_not(mask))
-            pad_on_white = cv2.add(pad_masked, white_bg)
+            # White outside the circle: one masked fill of the masked copy
+            pad_on_white = pad_masked.copy()
+            pad_on_white[mask == 0] = 255
             
             self.extracted_pads.append({
                 'id': i + 1,
@@ -1268,6 +1748,8 @@ class RedPadExtractorWindow(tk.Toplevel):
     def _update_gallery(self):
         """Update the gallery canvas with extracted pads."""
         self.gallery_canvas.delete("all")
+        # Only the thumbnails drawn below need to stay referenced
+        self.gallery_photos = []
         
         if not self.extracted_pads:
             return
@@ -1276,23 +1758,13 @@ class RedPadExtractorWindow(tk.Toplevel):
         thumb_size = 80
         
         for pad in self.extracted_pads[:15]:
-            img = pad['image']
-            
-            h, w = img.shape[:2]
-            scale = min(thumb_size/w, thumb_size/h)
-            new_w, new_h = int(w*scale), int(h*scale)
-            
-            thumb = cv2.resize(img, (new_w, new_h))
-            thumb_rgb = cv2.cvtColor(thumb, cv2.COLOR_BGR2RGB)
-            
-            photo = ImageTk.PhotoImage(image=Image.fromarray(thumb_rgb))
+            photo = _thumbnail_photo(pad['image'], (thumb_size, thumb_size))
+            new_w, new_h = photo.width(), photo.height()
             
             self.gallery_canvas.create_image(x_offset, 10, anchor=tk.NW, image=photo)
             self.gallery_canvas.create_text(x_offset + new_w//2, new_h + 20, 
                                            text=f"#{pad['id']}", fill=self.FG_COLOR)
             
-            if not hasattr(self, 'gallery_photos'):
-                self.gallery_photos = []
             self.gallery_photos.append(photo)
             
             x_offset += new_w + 15
@@ -1317,36 +1789,33 @@ class RedPadExtractorWindow(tk.Toplevel):
             self.update_idletasks()
             
             saved_files = []
+            jobs = []
             
             for pad in self.extracted_pads:
                 # Save with white background - using _red_padding suffix
                 filename = f"pad_{pad['id']:03d}_red_padding.png"
                 filepath = os.path.join(pads_folder, filename)
-                cv2.imwrite(filepath, pad['image'])
+                jobs.append((filepath, pad['image']))
                 saved_files.append(filename)
                 
                 # Also save circular crop (transparent background)
                 filename_alpha = f"pad_{pad['id']:03d}_red_padding_masked.png"
                 filepath_alpha = os.path.join(pads_folder, filename_alpha)
                 
-                b, g, r = cv2.split(pad['image_no_bg'])
-                alpha = pad['mask']
-                rgba = cv2.merge([b, g, r, alpha])
-                cv2.imwrite(filepath_alpha, rgba)
+                rgba = np.dstack((pad['image_no_bg'], pad['mask']))
+                jobs.append((filepath_alpha, rgba))
+            
+            _write_pngs(jobs)
             
             # Save summary
-            summary_path = os.path.join(pads_folder, "extraction_summary.txt")
-            with open(summary_path, 'w') as f:
-                f.write("RED PAD EXTRACTION SUMMARY\n")
-                f.write("=" * 40 + "\n\n")
-                f.write(f"Total pads extracted: {len(self.extracted_pads)}\n")
-                f.write(f"Hue Range 1: {self.hue_low1.get()}-{self.hue_high1.get()}\n")
-                f.write(f"Hue Range 2: {self.hue_low2.get()}-{self.hue_high2.get()}\n")
-                f.write(f"Saturation: {self.sat_low.get()}-{self.sat_high.get()}\n")
-                f.write(f"Value: {self.val_low.get()}-{self.val_high.get()}\n\n")
-                
-                for pad in self.extracted_pads:
-                    f.write(f"Pad #{pad['id']}: Center ({pad['center'][0]}, {pad['center'][1]}), R={pad['radius']}px\n")
+            _write_pad_summary(
+                os.path.join(pads_folder, "extraction_summary.txt"),
+                "RED PAD EXTRACTION SUMMARY",
+                [f"Hue Range 1: {self.hue_low1.get()}-{self.hue_high1.get()}",
+                 f"Hue Range 2: {self.hue_low2.get()}-{self.hue_high2.get()}",
+                 f"Saturation: {self.sat_low.get()}-{self.sat_high.get()}",
+                 f"Value: {self.val_low.get()}-{self.val_high.get()}"],
+                self.extracted_pads)
             
             self.status_var.set(f"Saved {len(saved_files)} red pads to: {pads_folder}")
             messagebox.showinfo("Saved", 
@@ -1365,21 +1834,10 @@ class RedPadExtractorWindow(tk.Toplevel):
         if cv2_image is None or cv2_image.size == 0:
             return
         
-        h, w = cv2_image.shape[:2]
-        ratio = min(size[0]/w, size[1]/h)
-        new_w, new_h = int(w * ratio), int(h * ratio)
-        
-        if new_w == 0 or new_h == 0:
+        photo, _ = _photo_for(cv2_image, size)
+        if photo is None:
             return
         
-        img_resized = cv2.resize(cv2_image, (new_w, new_h), interpolation=cv2.INTER_AREA)
-        
-        if len(img_resized.shape) == 2:
-            img_resized = cv2.cvtColor(img_resized, cv2.COLOR_GRAY2BGR)
-        
-        img_rgb = cv2.cvtColor(img_resized, cv2.COLOR_BGR2RGB)
-        photo = ImageTk.PhotoImage(image=Image.fromarray(img_rgb))
-        
         label.config(image=photo)
         label.image = photo
 
@@ -1541,6 +1999,13 @@ class InspectorApp(tk.Tk):
     }
     
     SUPPORTED_EXTS = (".png", ".jpg", ".jpeg", ".tif", ".tiff", ".bmp", ".bitmap", ".dib")
+    LOG_FILE = "inspection_log.csv"
+    LOG_HEADER = ["Timestamp", "File", "Status", "White_%", "Black_%"]
+    STATS_TEMPLATE = ("Status: {status}\n"
+                      "Mode: {mode}\n"
+                      "Black: {black_pct:.2f}% ({black_px} px)\n"
+                      "White: {white_pct:.2f}% ({white_px} px)\n"
+                      "Defects: {defects}\n")
     
     def __init__(self):
         super().__init__()
@@ -1562,6 +2027,8 @@ class InspectorApp(tk.Tk):
         
         # New Feature State
         self.filter_method = tk.StringVar(value="Gaussian")
+        self._filter_method = self.filter_method.get()  # Cached for _make_binary
+        self.filter_method.trace_add("write", self._on_filter_method_write)
         self.use_clahe = tk.BooleanVar(value=False)
         self.show_overlay = tk.BooleanVar(value=True)
         self.show_auto_in_list = tk.BooleanVar(value=False)
@@ -1569,6 +2036,18 @@ class InspectorApp(tk.Tk):
         self.manual_labels = []
         self.idx = 0
         self.results = []  # Batch results
+        self._processing_busy = False  # Batch worker running
+        self._gb_scratch = threading.local()  # Per-thread blur buffers
+        # Preview binarization runs here; one worker, at most one job in flight
+        self._preview_pool = ThreadPoolExecutor(max_workers=1)
+        self._preview_future = None
+        self._preview_stale = False  # Settings changed while a preview ran
+        self._refresh_job = None  # Pending debounced slider refresh
+        self._overlay_inputs = ()  # What the bw_canvas overlay was drawn from
+        self._coords_text = "XY: -"  # Latest text for lbl_coords
+        self._coords_job = None  # Pending after_idle label update
+        self._log_fp = None  # Inspection log, opened on first write
+        self._log_writer = None
         
         self.current_image = None
         self.current_alpha = None
@@ -1576,6 +2055,7 @@ class InspectorApp(tk.Tk):
         self.current_alpha = None
         self.current_bw = None
         self.current_mask_bool = None # Cache for fast updates
+        self.current_stats = None # _compute_stats of the two above
         self.files = [] # Initialize files list
         
         # Roboflow Client
@@ -1596,6 +2076,7 @@ class InspectorApp(tk.Tk):
         self._setup_styles()
         self._build_menu()
         self._build_ui()
+        self.protocol("WM_DELETE_WINDOW", self._on_close)
     
     def _setup_styles(self):
         """Configure ttk styles for the application."""
@@ -1679,7 +2160,9 @@ class InspectorApp(tk.Tk):
         
     def _open_log_file(self):
         import subprocess
-        log_file = "inspection_log.csv" # Should ideally be shared constant
+        log_file = self.LOG_FILE
+        if self._log_fp is not None:
+            self._log_fp.flush()
         if os.path.exists(log_file):
             subprocess.run(['explorer', '/select,', os.path.abspath(log_file)])
             
@@ -1692,6 +2175,10 @@ class InspectorApp(tk.Tk):
         for win in list(self.tool_windows.values()):
             if win.winfo_exists():
                 win.destroy()
+        if self._log_fp is not None:
+            self._log_fp.close()
+            self._log_fp = None
+        self._preview_pool.shutdown(wait=False)
         self.destroy()
         sys.exit(0)
 
@@ -1732,8 +2219,8 @@ class InspectorApp(tk.Tk):
         self.scroll_content.bind("<Configure>", self._on_frame_configure)
         self.controls_canvas.bind("<Configure>", self._on_canvas_configure)
         
-        # Mousewheel scrolling (bind to canvas in this area)
-        self.controls_canvas.bind_all("<MouseWheel>", self._on_mousewheel)
+        # Mousewheel scrolling (only while the pointer is over the controls)
+        _bind_wheel_while_hovered(self.controls_canvas, self._on_mousewheel)
 
         # Pointer to where we actually add widgets (renamed for clarity in diff, but using old var name to minimize changes below would be easier... 
         # actually let's re-assign controls_frame to point to our new inner frame so the rest of the code works with minimal changes)
@@ -2121,37 +2608,41 @@ class InspectorApp(tk.Tk):
 
     def _on_hsv_change(self, val):
         """Live update when sliding."""
-        self._refresh_preview()
+        self._debounce("_refresh_job", self._refresh_preview)
 
     def _preview_mask_only(self):
         """Show JUST the Gold Mask in the preview window for tuning."""
         if self.current_image is None: return
         
-        hsv_mask = self._get_hsv_mask(self.current_image)
+        hsv_mask = self._get_hsv_mask(self.current_image, self._hsv_bounds())
         
         # Show in Preview Canvas (Original side) temporarily
-        self._display_on_canvas(hsv_mask, self.orig_canvas, is_gray=True)
+        self._display_on_canvas(hsv_mask, self.orig_canvas, is_gray=True, fast=True)
         self.status_var.set("Showing HSV Mask (White = Keep, Black = Ignore). Move sliders to tune.")
 
-    def _get_hsv_mask(self, rgb_img):
-        """Compute the HSV mask based on current sliders."""
+    def _hsv_bounds(self):
+        """Snapshot the HSV slider range as (lower, upper) tuples."""
+        lower = (self.hue_min.get(), self.sat_min.get(), self.val_min.get())
+        upper = (self.hue_max.get(), self.sat_max.get(), self.val_max.get())
+        return lower, upper
+
+    def _get_hsv_mask(self, rgb_img, hsv_bounds):
+        """Compute the HSV mask for the given (lower, upper) slider range."""
         # Convert RGB to BGR for OpenCV (if needed) or directly to HSV
         # Note: self.current_image is RGB from _read_image_with_alpha usually
         # But cv2.cvtColor(rgb, cv2.COLOR_RGB2HSV) works too.
         
         hsv = cv2.cvtColor(rgb_img, cv2.COLOR_RGB2HSV)
         
-        lower = np.array([self.hue_min.get(), self.sat_min.get(), self.val_min.get()])
-        upper = np.array([self.hue_max.get(), self.sat_max.get(), self.val_max.get()])
-        
+        lower, upper = hsv_bounds
         mask = cv2.inRange(hsv, lower, upper)
         
-        # Optional cleanup
-        kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3,3))
-        mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, kernel)
-        mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel)
-        
-        return mask
+        # Optional cleanup: open then close, issued as erode -> dilate(x2) ->
+        # erode so the back-to-back dilations are one call. The square
+        # kernel runs as a separable row/column pass.
+        mask = cv2.erode(mask, _K3_RECT)
+        mask = cv2.dilate(mask, _K3_RECT, iterations=2)
+        return cv2.erode(mask, _K3_RECT)
 
 
     
@@ -2222,21 +2713,15 @@ class InspectorApp(tk.Tk):
     
     def _masked_gaussian_smooth(self, gray01, mask01, sigma):
         """Normalized masked Gaussian (avoid boundary bleeding)."""
-        if sigma <= 0:
-            out = gray01.copy()
-            out[mask01 <= 0] = 0.0
-            return out
-        
-        k = int(6 * sigma + 1)
-        if k % 2 == 0:
-            k += 1
-        k = max(k, 3)
-        
-        num = cv2.GaussianBlur(gray01 * mask01, (k, k), sigmaX=sigma, sigmaY=sigma, borderType=cv2.BORDER_REFLECT)
-        den = cv2.GaussianBlur(mask01, (k, k), sigmaX=sigma, sigmaY=sigma, borderType=cv2.BORDER_REFLECT)
-        out = num / (den + 1e-8)
-        out[mask01 <= 0] = 0.0
-        return out
+        # Reuse the blur buffers across previews; thread-local so the batch
+        # worker and the live preview never write into the same arrays.
+        scratch = self._gb_scratch
+        shape = gray01.shape[:2] + (2,)
+        if getattr(scratch, 'packed', None) is None or scratch.packed.shape != shape:
+            scratch.packed = np.empty(shape, np.float32)
+            scratch.blurred = np.empty(shape, np.float32)
+        return masked_gaussian_smooth(gray01, mask01, sigma,
+                                      scratch=(scratch.packed, scratch.blurred))
     
     def _compute_otsu_threshold(self, gray_u8, mask_bool=None):
         """Compute Otsu's optimal threshold, normalized to 0-1."""
@@ -2270,13 +2755,17 @@ class InspectorApp(tk.Tk):
     
     def _make_binary(self, rgb, alpha, sigma=1.2, thresh=0.65, 
                       use_adaptive=False, block_size=11, c_value=2,
-                      use_hsv=False):
-        """RGB -> Gray -> Filter (Gaussian/Bilateral/Median) -> Threshold -> BW."""
+                      use_hsv=False, use_clahe=False, hsv_bounds=None):
+        """RGB -> Gray -> Filter (Gaussian/Bilateral/Median) -> Threshold -> BW.
+        
+        Takes every setting as an argument (see _binary_params) so the
+        preview and batch workers never touch Tk variables.
+        """
         
         # 0. HSV Masking (Gold Focus)
         gold_mask = None
         if use_hsv:
-            gold_mask = self._get_hsv_mask(rgb)
+            gold_mask = self._get_hsv_mask(rgb, hsv_bounds)
         
         
 
@@ -2284,7 +2773,7 @@ class InspectorApp(tk.Tk):
         gray = cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY)
         
         # 2. CLAHE
-        if self.use_clahe.get():
+        if use_clahe:
             clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
             gray = clahe.apply(gray)
             
@@ -2299,7 +2788,7 @@ class InspectorApp(tk.Tk):
         gray_u8 = np.clip(gray_f * 255.0, 0, 255).astype(np.uint8)
         
         # 4. Smoothing / Filtering
-        f_method = self.filter_method.get()
+        f_method = self._filter_method
         if f_method == "Gaussian":
             # Using internal helper
             smooth_f = self._masked_gaussian_smooth(gray_f, mask01, float(sigma))
@@ -2358,8 +2847,9 @@ class InspectorApp(tk.Tk):
 
         # [HSV INTEGRATION STEP]
         if use_hsv and gold_mask is not None:
-            bg_mask = cv2.bitwise_not(gold_mask)
-            bw = cv2.bitwise_or(bw, bg_mask)
+            # Both buffers are ours, so invert and merge in place
+            cv2.bitwise_not(gold_mask, dst=gold_mask)
+            cv2.bitwise_or(bw, gold_mask, dst=bw)
 
         # Removed Morphological Stabilization (noise_level)
 
@@ -2583,35 +3073,61 @@ class InspectorApp(tk.Tk):
             self.class_label.config(text="Error")
             messagebox.showerror("Inference Error", str(e))
 
+    def _on_filter_method_write(self, *args):
+        """Cache the filter choice so _make_binary (also run by the batch worker) skips the Tcl lookup."""
+        self._filter_method = self.filter_method.get()
+
     def _on_manual_change(self, *args):
         """Handle manual slider adjustment -> switch to Custom preset."""
         if self.preset_var.get() != "Custom":
             self.preset_var.set("Custom")
-        self._refresh_preview()
+        self._debounce("_refresh_job", self._refresh_preview)
+    
+    def _debounce(self, attr, fn, *args, delay=50):
+        """Run fn(*args) once, delay ms after the last call for the same attr.
+        
+        A slider drag fires its command for every pixel moved; only the
+        final position needs a refresh.
+        """
+        job = getattr(self, attr, None)
+        if job is not None:
+            self.after_cancel(job)
+        
+        def run():
+            setattr(self, attr, None)
+            fn(*args)
+        setattr(self, attr, self.after(delay, run))
 
+    def _binary_params(self):
+        """Snapshot the binarization settings as plain values for worker threads."""
+        return {
+            "sigma": float(self.sigma.get()),
+            "thresh": float(self.thresh.get()),
+            "use_adaptive": self.use_adaptive.get(),
+            "block_size": int(self.adaptive_block_size.get()),
+            "c_value": int(self.adaptive_c.get()),
+            "use_hsv": self.use_hsv.get(),
+            "use_clahe": self.use_clahe.get(),
+            "hsv_bounds": self._hsv_bounds(),
+        }
+    
+    def _post(self, callback, *args):
+        """Run ``callback(*args)`` on the Tk thread (worker side)."""
+        try:
+            self.after(0, callback, *args)
+        except (RuntimeError, tk.TclError):
+            pass  # Window closed while the worker ran
+    
     def _refresh_preview(self):
-        """Refresh preview with current settings."""
+        """Refresh preview with current settings.
+        
+        Binarization and defect analysis run on the preview worker so slider
+        drags don't block the UI. Requests arriving while one is running
+        only mark it stale; it is rerun once with the latest settings.
+        """
         if self.current_image is None:
             return
         
-        use_adaptive = self.use_adaptive.get()
-        use_hsv = self.use_hsv.get()
-        
-        result = self._make_binary(
-            self.current_image,
-            self.current_alpha,
-            sigma=float(self.sigma.get()),
-            thresh=float(self.thresh.get()),
-            use_adaptive=use_adaptive,
-            block_size=int(self.adaptive_block_size.get()),
-            c_value=int(self.adaptive_c.get()),
-            use_hsv=use_hsv
-        )
-        _, _, bw_u8, mask_bool, auto_params = result
-        
-        self.current_bw = bw_u8
-        self.current_mask_bool = mask_bool # Cache it
-        
         # Update labels based on mode
         self.sigma_label.configure(text=f"{self.sigma.get():.2f}")
         self.thresh_label.configure(text=f"{self.thresh.get():.2f}")
@@ -2621,13 +3137,45 @@ class InspectorApp(tk.Tk):
         self.block_label.configure(text=str(block_val))
         self.c_label.configure(text=str(int(self.adaptive_c.get())))
         
-        self.current_bw = bw_u8
+        if self._preview_future is not None:
+            self._preview_stale = True
+            return
         
-        # Defect Analysis
-        self.auto_defects, _ = analyze_defects(bw_u8, mask_bool)
+        image, alpha = self.current_image, self.current_alpha
+        params = self._binary_params()
+        self._preview_future = self._preview_pool.submit(self._preview_worker, image, alpha, params)
+        self._preview_future.add_done_callback(
+            lambda f: self._post(self._finish_preview, image, params, f))
+    
+    def _preview_worker(self, rgb, alpha, params):
+        """Binarize and analyse one image for the preview (worker thread)."""
+        _, _, bw_u8, mask_bool, _ = self._make_binary(rgb, alpha, **params)
+        defects, _ = analyze_defects(bw_u8, mask_bool)
+        return bw_u8, mask_bool, defects, self._compute_stats(bw_u8, mask_bool)
+    
+    def _finish_preview(self, image, params, future):
+        """Publish a finished preview on the Tk thread, then run a queued refresh."""
+        self._preview_future = None
+        try:
+            result = future.result()
+        except (cv2.error, ValueError) as e:
+            self.status_var.set(f"Preview error: {e}")
+            result = None
         
-        # Compute stats
-        white_px, black_px, area_px, white_pct, black_pct = self._compute_stats(bw_u8, mask_bool)
+        # A preview of an image that has since been replaced is dropped
+        if result is not None and image is self.current_image:
+            self._apply_preview(params, *result)
+        
+        if self._preview_stale:
+            self._preview_stale = False
+            self._refresh_preview()
+    
+    def _apply_preview(self, params, bw_u8, mask_bool, defects, stats):
+        """Show a computed preview: verdict, stats and both canvases."""
+        self.current_bw = bw_u8
+        self.current_mask_bool = mask_bool # Cache it
+        self.current_stats = stats
+        self.auto_defects = defects
         
         # Find the defect type with the most total area
         dominant_defect_type = ""
@@ -2639,30 +3187,13 @@ class InspectorApp(tk.Tk):
             if area_by_type:
                 dominant_defect_type = max(area_by_type, key=area_by_type.get)
         
-        if black_pct > float(self.black_defect_pct.get()):
-            status = "DEFECT"
-            if dominant_defect_type:
-                self.result_label.config(text=f"⚠ {dominant_defect_type} ({len(self.auto_defects)})", fg="#FF4444")
-            else:
-                self.result_label.config(text=f"⚠ DEFECT ({len(self.auto_defects)})", fg="#FF4444")
-        else:
-            status = "OK"
-            self.result_label.config(text=f"✓ OK ({len(self.auto_defects)})", fg="#00FF41")
+        mode_str = "Adaptive" if params["use_adaptive"] else "Manual"
+        self._show_verdict(stats, mode_str, dominant_defect_type)
             
         # Update Info
         if self.files:
             base = os.path.basename(self.files[self.idx])
             self.nav_info.config(text=f"{self.idx+1}/{len(self.files)}: {base}")
-            
-        # Stats Text
-        mode_str = "Adaptive" if use_adaptive else "Manual"
-        
-        self.stats_text.delete(1.0, tk.END)
-        self.stats_text.insert(tk.END, f"Status: {status}\n")
-        self.stats_text.insert(tk.END, f"Mode: {mode_str}\n")
-        self.stats_text.insert(tk.END, f"Black: {black_pct:.2f}% ({black_px} px)\n")
-        self.stats_text.insert(tk.END, f"White: {white_pct:.2f}% ({white_px} px)\n")
-        self.stats_text.insert(tk.END, f"Defects: {len(self.auto_defects)}\n")
         
         self._display_on_canvas(self.current_image, self.orig_canvas, is_rgb=True)
         self._refresh_visualization()
@@ -2682,7 +3213,21 @@ class InspectorApp(tk.Tk):
         for m in self.manual_labels:
             self.tree.insert("", "end", values=(f"M{m['id']}", m['type'], m['area']), tags="manual")
             
-        # 2. Update Image Overlay
+        # 2. Update Image Overlay, unless it was drawn from these same objects
+        # (e.g. only "List Auto" was toggled). Labels are replaced, not mutated.
+        inputs = (self.current_bw, self.auto_defects, self.manual_labels, self.show_overlay.get())
+        if len(inputs) == len(self._overlay_inputs) and all(
+                a is b for a, b in zip(inputs, self._overlay_inputs)):
+            return
+        self._overlay_inputs = inputs
+        
+        # Nothing to annotate: show the binary image itself. It goes to Tk
+        # as an 'L' image with no 3-channel expansion, and being the same
+        # array each time it hits the photo cache on later redraws.
+        if not (self.show_overlay.get() and (self.auto_defects or self.manual_labels)):
+            self._display_on_canvas(self.current_bw, self.bw_canvas)
+            return
+        
         vis_img = cv2.cvtColor(self.current_bw, cv2.COLOR_GRAY2RGB)
         
         if self.show_overlay.get():
@@ -2697,38 +3242,36 @@ class InspectorApp(tk.Tk):
                  
         self._display_on_canvas(vis_img, self.bw_canvas)
 
+    def _show_verdict(self, stats, mode_str, dominant_defect_type=""):
+        """Set the verdict label and stats text from _compute_stats output."""
+        white_px, black_px, _, white_pct, black_pct = stats
+        count = len(self.auto_defects)
+        if black_pct > float(self.black_defect_pct.get()):
+            status = "DEFECT"
+            self.result_label.config(text=f"⚠ {dominant_defect_type or 'DEFECT'} ({count})", fg="#FF4444")
+        else:
+            status = "OK"
+            self.result_label.config(text=f"✓ OK ({count})", fg="#00FF41")
+        
+        self.stats_text.delete(1.0, tk.END)
+        self.stats_text.insert(tk.END, self.STATS_TEMPLATE.format_map({
+            'status': status, 'mode': mode_str,
+            'black_pct': black_pct, 'black_px': black_px,
+            'white_pct': white_pct, 'white_px': white_px,
+            'defects': count}))
+
     def _on_verdict_change(self, *args):
         """Handle change in defect % threshold efficiently."""
         if self.current_bw is None or self.current_mask_bool is None: 
             return
             
         try:
-            # Re-read threshold
-            black_th = float(self.black_defect_pct.get())
-            
-            # Re-compute verdict using cached binary and mask
-            # We don't need to re-compute stats if we stored them, but comp stats is fast.
-            white_px, black_px, area_px, white_pct, black_pct = self._compute_stats(self.current_bw, self.current_mask_bool)
-            
-            if black_pct > black_th:
-                status = "DEFECT"
-                self.result_label.config(text=f"⚠ DEFECT ({len(self.auto_defects)})", fg="#FF4444")
-            else:
-                status = "OK"
-                self.result_label.config(text=f"✓ OK ({len(self.auto_defects)})", fg="#00FF41")
-            
-            # Update stats text status only (quick hack or full rewrite)
-            # Full consistency requires updating stats text.
-            # Using current values from UI/Logic:
-            use_adaptive = self.use_adaptive.get()
-            mode_str = "Adaptive" if use_adaptive else "Manual"
-            
-            self.stats_text.delete(1.0, tk.END)
-            self.stats_text.insert(tk.END, f"Status: {status}\n")
-            self.stats_text.insert(tk.END, f"Mode: {mode_str}\n")
-            self.stats_text.insert(tk.END, f"Black: {black_pct:.2f}% ({black_px} px)\n")
-            self.stats_text.insert(tk.END, f"White: {white_pct:.2f}% ({white_px} px)\n")
-            self.stats_text.insert(tk.END, f"Defects: {len(self.auto_defects)}\n")
+            # Only the threshold changed: re-judge the stats cached with the
+            # binary instead of recounting the image
+            if self.current_stats is None:
+                self.current_stats = self._compute_stats(self.current_bw, self.current_mask_bool)
+            mode_str = "Adaptive" if self.use_adaptive.get() else "Manual"
+            self._show_verdict(self.current_stats, mode_str)
             
         except (ValueError, tk.TclError):
             pass # Handle invalid number input gracefully (e.g., empty string during typing)
@@ -2768,7 +3311,8 @@ class InspectorApp(tk.Tk):
 
     def _open_labeler(self):
         if self.current_image is None: return
-        DefectLabelerWindow(self, self.current_image.copy(), self.manual_labels, self._update_labels)
+        # The labeler only reads the image, and a new load rebinds current_image
+        DefectLabelerWindow(self, self.current_image, self.manual_labels, self._update_labels)
         
     def _update_labels(self, new_labels):
         self.manual_labels = new_labels
@@ -2803,6 +3347,8 @@ class InspectorApp(tk.Tk):
     
     def _process_all(self):
         """Process all images and save to OK/DEFECT folders."""
+        if self._processing_busy:
+            return
         if not self.files:
             messagebox.showwarning("No Images", "Please select an input folder first.")
             return
@@ -2818,65 +3364,107 @@ class InspectorApp(tk.Tk):
         os.makedirs(out_ok, exist_ok=True)
         os.makedirs(out_ng, exist_ok=True)
         
-        use_adaptive = self.use_adaptive.get()
-        sigma = float(self.sigma.get())
-        thresh = float(self.thresh.get())
-        block_size = int(self.adaptive_block_size.get())
-        c_value = int(self.adaptive_c.get())
+        params = self._binary_params()
         black_th = float(self.black_defect_pct.get())
         
-        self.results = []
+        # Heavy OpenCV work releases the GIL, so the UI stays responsive
+        self._processing_busy = True
+        threading.Thread(
+            target=self._process_all_worker,
+            args=(list(self.files), out_ok, out_ng, params, black_th),
+            daemon=True
+        ).start()
+    
+    def _process_all_worker(self, files, out_ok, out_ng, params, black_th):
+        """Batch worker: binarize and save each file, then post results to the UI thread."""
+        results = []
         defect_count = 0
         
-        for i, path in enumerate(self.files, start=1):
-            self.status_var.set(f"Processing {i}/{len(self.files)}: {os.path.basename(path)}")
-            self.update_idletasks()
-            
-            try:
-                rgb, alpha = self._read_image_with_alpha(path)
-                result = self._make_binary(rgb, alpha, sigma=sigma, thresh=thresh, 
-                                          use_adaptive=use_adaptive,
-                                          block_size=block_size, c_value=c_value,
-                                          use_hsv=self.use_hsv.get())
-                _, _, bw, mask_bool, _ = result
-                
-                white_px, black_px, area_px, white_pct, black_pct = self._compute_stats(bw, mask_bool)
-                status = "DEFECT" if black_pct > black_th else "OK"
-                
-                if status == "DEFECT":
-                    defect_count += 1
-                
-                # Save to appropriate folder
-                base = os.path.splitext(os.path.basename(path))[0]
-                save_dir = out_ng if status == "DEFECT" else out_ok
-                out_path = os.path.join(save_dir, f"{base}_BW.png")
-                cv2.imwrite(out_path, bw)
+        try:
+            for i, path in enumerate(files, start=1):
+                self._post(self.status_var.set, f"Processing {i}/{len(files)}: {os.path.basename(path)}")
                 
-                self.results.append({
-                    "path": path,
-                    "rgb": rgb,
-                    "bw": bw,
-                    "white_pct": white_pct,
-                    "black_pct": black_pct,
-                    "status": status,
-                })
-            except Exception as e:
-                self.results.append({
-                    "path": path,
-                    "error": str(e),
-                    "status": "ERROR"
-                })
+                try:
+                    rgb, alpha = self._read_image_with_alpha(path)
+                    result = self._make_binary(rgb, alpha, **params)
+                    _, _, bw, mask_bool, _ = result
+                    
+                    white_px, black_px, area_px, white_pct, black_pct = self._compute_stats(bw, mask_bool)
+                    status = "DEFECT" if black_pct > black_th else "OK"
+                    
+                    if status == "DEFECT":
+                        defect_count += 1
+                    
+                    # Save to appropriate folder
+                    base = os.path.splitext(os.path.basename(path))[0]
+                    save_dir = out_ng if status == "DEFECT" else out_ok
+                    out_path = os.path.join(save_dir, f"{base}_BW.png")
+                    write_encoded(out_path, bw, ".png", _BW_PNG_WRITE_PARAMS)
+                    
+                    results.append({
+                        "path": path,
+                        "rgb": rgb,
+                        "bw": bw,
+                        "white_pct": white_pct,
+                        "black_pct": black_pct,
+                        "status": status,
+                    })
+                except (cv2.error, ValueError, OSError) as e:
+                    # Bad/unreadable image: record it and keep going
+                    results.append({
+                        "path": path,
+                        "error": str(e),
+                        "status": "ERROR"
+                    })
+        except Exception as e:
+            # A bug, not a bad image: stop the batch and surface it once
+            self._post(self._abort_process_all, e)
+            raise
         
-        self.status_var.set(f"Done! {defect_count}/{len(self.files)} defects found")
+        self._post(self._finish_process_all, results, defect_count, out_ok, out_ng)
+    
+    def _abort_process_all(self, error):
+        """Reset batch state after the worker died on an unexpected error."""
+        self._processing_busy = False
+        self.status_var.set(f"Batch aborted: {error}")
+        messagebox.showerror("Processing Error", str(error))
+    
+    def _finish_process_all(self, results, defect_count, out_ok, out_ng):
+        """Publish batch results on the Tk thread."""
+        self._processing_busy = False
+        self.results = results
+        total = len(results)
+        self._log_results(results)
+        
+        self.status_var.set(f"Done! {defect_count}/{total} defects found")
         
         messagebox.showinfo("Processing Complete",
-            f"Processed {len(self.files)} images.\n\n"
+            f"Processed {total} images.\n\n"
             f"DEFECT: {defect_count}\n"
-            f"OK: {len(self.files) - defect_count}\n\n"
+            f"OK: {total - defect_count}\n\n"
             f"Saved to:\n• {out_ok}\n• {out_ng}")
         
         self._load_current()
     
+    def _log_results(self, results):
+        """Append batch results to the inspection log CSV."""
+        # The handle stays open for the app's lifetime; flushed once per batch.
+        # A 64 KiB buffer holds a typical batch, so the flush is one write.
+        if self._log_writer is None:
+            is_new = not os.path.exists(self.LOG_FILE)
+            self._log_fp = open(self.LOG_FILE, 'a', newline='', buffering=64 * 1024)
+            self._log_writer = csv.writer(self._log_fp)
+            if is_new:
+                self._log_writer.writerow(self.LOG_HEADER)
+        
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        self._log_writer.writerows(
+            [timestamp, r["path"], r["status"],
+             f"{r.get('white_pct', 0.0):.2f}", f"{r.get('black_pct', 0.0):.2f}"]
+            for r in results
+        )
+        self._log_fp.flush()
+    
     def _open_overview(self):
         """Open overview window showing all results."""
         if not self.results:
@@ -2890,21 +3478,14 @@ class InspectorApp(tk.Tk):
     
     def _quick_process(self):
         """Quick process all images without saving (for overview)."""
-        use_adaptive = self.use_adaptive.get()
-        sigma = float(self.sigma.get())
-        thresh = float(self.thresh.get())
-        block_size = int(self.adaptive_block_size.get())
-        c_value = int(self.adaptive_c.get())
+        params = self._binary_params()
         black_th = float(self.black_defect_pct.get())
         
         self.results = []
         for path in self.files:
             try:
                 rgb, alpha = self._read_image_with_alpha(path)
-                result = self._make_binary(rgb, alpha, sigma=sigma, thresh=thresh, 
-                                          use_adaptive=use_adaptive,
-                                          block_size=block_size, c_value=c_value,
-                                          use_hsv=self.use_hsv.get())
+                result = self._make_binary(rgb, alpha, **params)
                 _, _, bw, mask_bool, _ = result
                 _, _, _, white_pct, black_pct = self._compute_stats(bw, mask_bool)
                 status = "DEFECT" if black_pct > black_th else "OK"
@@ -2912,11 +3493,17 @@ class InspectorApp(tk.Tk):
                     "path": path, "rgb": rgb, "bw": bw,
                     "white_pct": white_pct, "black_pct": black_pct, "status": status
                 })
-            except Exception as e:
+            except (cv2.error, ValueError, OSError) as e:
+                # Bad/unreadable image: record it; anything else is a bug
                 self.results.append({"path": path, "error": str(e), "status": "ERROR"})
     
-    def _display_on_canvas(self, img, canvas, size=(450, 400), is_gray=False, is_rgb=False):
-        """Display image on canvas with centering and metadata."""
+    def _display_on_canvas(self, img, canvas, size=(450, 400), is_gray=False, is_rgb=False,
+                           fast=False):
+        """Display image on canvas with centering and metadata.
+        
+        ``fast`` samples with INTER_NEAREST, for live previews of masks where
+        filtering buys nothing.
+        """
         if img is None or img.size == 0:
             return
         
@@ -2929,73 +3516,73 @@ class InspectorApp(tk.Tk):
         if cw > 10 and ch > 10:
             size = (cw, ch)
             
-        ratio = min(size[0]/w, size[1]/h)
-        new_w, new_h = int(w * ratio), int(h * ratio)
-        
-        if new_w <= 0 or new_h <= 0:
+        photo, ratio = _photo_for(img, size, is_rgb=is_rgb,
+                                  interpolation=cv2.INTER_NEAREST if fast else cv2.INTER_LINEAR)
+        if photo is None:
             return
-            
-        img_resized = cv2.resize(img, (new_w, new_h), interpolation=cv2.INTER_AREA)
-        
-        if is_gray or len(img_resized.shape) == 2:
-            img_resized = cv2.cvtColor(img_resized, cv2.COLOR_GRAY2RGB)
-        elif not is_rgb:
-            img_resized = cv2.cvtColor(img_resized, cv2.COLOR_BGR2RGB)
-        
-        photo = ImageTk.PhotoImage(image=Image.fromarray(img_resized))
+        new_w, new_h = photo.width(), photo.height()
         
         # Center in canvas
         off_x = (size[0] - new_w) // 2
         off_y = (size[1] - new_h) // 2
         
-        canvas.delete("all")
-        canvas.create_image(off_x, off_y, anchor=tk.NW, image=photo)
-        canvas.image = photo # Keep reference
+        _blit_to_canvas(canvas, photo, off_x, off_y)
         
-        # Store metadata for coordinates
-        self.canvas_meta[canvas] = (ratio, off_x, off_y, w, h)
+        # Store metadata for coordinates; the inverse ratio spares the
+        # motion handler a division per event
+        inv_ratio = 1.0 / ratio if ratio > 0 else 0.0
+        self.canvas_meta[canvas] = (ratio, off_x, off_y, w, h, inv_ratio)
 
     def _on_mouse_move(self, event):
         """Track mouse coordinates."""
-        canvas = event.widget
-        if canvas not in self.canvas_meta:
+        meta = self.canvas_meta.get(event.widget)
+        if meta is None:
             return
             
-        ratio, off_x, off_y, orig_w, orig_h = self.canvas_meta[canvas]
+        _, off_x, off_y, orig_w, orig_h, inv_ratio = meta
         
-        # Canvas coords
-        cx, cy = event.x, event.y
-        
-        # Image coords
-        if ratio > 0:
-            ix = int((cx - off_x) / ratio)
-            iy = int((cy - off_y) / ratio)
-        else:
-            ix, iy = 0, 0
+        # Image coords (inv_ratio is 0 for a degenerate display, giving 0, 0)
+        ix = int((event.x - off_x) * inv_ratio)
+        iy = int((event.y - off_y) * inv_ratio)
             
         # Check bounds
         if 0 <= ix < orig_w and 0 <= iy < orig_h:
-            self.lbl_coords.config(text=f"XY: {ix}, {iy}")
+            self._set_coords_text(f"XY: {ix}, {iy}")
             self._draw_crosshair(self.orig_canvas, ix, iy)
             self._draw_crosshair(self.bw_canvas, ix, iy)
         else:
-            self.lbl_coords.config(text="XY: -")
-            self.orig_canvas.delete("crosshair")
-            self.bw_canvas.delete("crosshair")
+            self._set_coords_text("XY: -")
+            self.orig_canvas.itemconfigure("crosshair", state="hidden")
+            self.bw_canvas.itemconfigure("crosshair", state="hidden")
 
     def _on_mouse_leave(self, event):
         """Clear coordinates on leave."""
-        self.lbl_coords.config(text="XY: -")
-        self.orig_canvas.delete("crosshair")
-        self.bw_canvas.delete("crosshair")
+        self._set_coords_text("XY: -")
+        self.orig_canvas.itemconfigure("crosshair", state="hidden")
+        self.bw_canvas.itemconfigure("crosshair", state="hidden")
+
+    def _set_coords_text(self, text):
+        """Update lbl_coords once per idle cycle, however many motion events arrive."""
+        self._coords_text = text
+        if self._coords_job is None:
+            self._coords_job = self.after_idle(self._flush_coords_text)
+
+    def _flush_coords_text(self):
+        self._coords_job = None
+        self.lbl_coords.config(text=self._coords_text)
 
     def _draw_crosshair(self, canvas, img_x, img_y):
-        """Draw crosshair on target canvas."""
-        canvas.delete("crosshair")
-        if canvas not in self.canvas_meta:
+        """Draw crosshair on target canvas.
+        
+        The two dashed lines are created once per canvas and then only
+        moved, instead of being deleted and recreated on every motion event.
+        """
+        meta = self.canvas_meta.get(canvas)
+        if meta is None:
+            canvas.itemconfigure("crosshair", state="hidden")
             return
             
-        ratio, off_x, off_y, w, h = self.canvas_meta[canvas]
+        ratio, off_x, off_y = meta[:3]
         
         # Target canvas coords
         tx = int(img_x * ratio + off_x)
@@ -3004,8 +3591,13 @@ class InspectorApp(tk.Tk):
         cw = canvas.winfo_width()
         ch = canvas.winfo_height()
         
-        canvas.create_line(0, ty, cw, ty, fill="cyan", tags="crosshair", dash=(4, 4))
-        canvas.create_line(tx, 0, tx, ch, fill="cyan", tags="crosshair", dash=(4, 4))
+        if canvas.find_withtag("crosshair"):
+            canvas.coords("crosshair_h", 0, ty, cw, ty)
+            canvas.coords("crosshair_v", tx, 0, tx, ch)
+            canvas.itemconfigure("crosshair", state="normal")
+        else:
+            canvas.create_line(0, ty, cw, ty, fill="cyan", tags=("crosshair", "crosshair_h"), dash=(4, 4))
+            canvas.create_line(tx, 0, tx, ch, fill="cyan", tags=("crosshair", "crosshair_v"), dash=(4, 4))
 
 
 class OverviewWindow(tk.Toplevel):
@@ -3066,9 +3658,8 @@ class OverviewWindow(tk.Toplevel):
             except tk.TclError:
                 pass
         
-        # Bind only to this canvas/window focus instead of global bind_all which causes issues
-        # But for scroll, bind_all is common. Let's just safeguard the callback.
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        # Only while hovered, so the main window's controls keep their wheel
+        _bind_wheel_while_hovered(canvas, _on_mousewheel)
         
         # Unbind on destroy to prevent calling destroyed widget
         def _unbind(event):
@@ -3110,15 +3701,10 @@ class OverviewWindow(tk.Toplevel):
         if rgb_img is None:
             return None
         
-        h, w = rgb_img.shape[:2]
-        ratio = min(max_size[0]/w, max_size[1]/h)
-        new_w, new_h = int(w * ratio), int(h * ratio)
-        
-        if new_w == 0 or new_h == 0:
+        thumb, _ = _resize_for_display(rgb_img, max_size)
+        if thumb is None:
             return None
-        
-        thumb = cv2.resize(rgb_img, (new_w, new_h), interpolation=cv2.INTER_AREA)
-        return ImageTk.PhotoImage(image=Image.fromarray(thumb))
+        return _to_photo(thumb, is_rgb=True)
     
     def _show_detail(self, res):
         """Show detail window for a result."""
@@ -3180,8 +3766,6 @@ class QRCropperTab(tk.Frame):
         super().__init__(parent, bg=self.BG_COLOR)
         self.app = app  # Reference to main app
         
-        # Import QR extractor
-        from .qr_cropper import QRCodeExtractor
         self.extractor = QRCodeExtractor()
         
         self.current_image = None
@@ -3289,9 +3873,8 @@ class QRCropperTab(tk.Frame):
             if not results:
                 self.results_text.insert(tk.END, "No QR codes detected.")
             else:
-                self.results_text.insert(tk.END, f"Found {len(results)} QR code(s):\n\n")
-                for qr in results:
-                    self.results_text.insert(tk.END, f"#{qr['id']}: {qr['data']}\n")
+                self.results_text.insert(tk.END, f"Found {len(results)} QR code(s):\n\n"
+                                         + "".join(f"#{qr['id']}: {qr['data']}\n" for qr in results))
         except Exception as e:
             self.results_text.insert(tk.END, f"Error: {str(e)}")
     
@@ -3317,16 +3900,9 @@ class QRCropperTab(tk.Frame):
         """Display image in the label."""
         if cv2_image is None:
             return
-        h, w = cv2_image.shape[:2]
-        ratio = min(size[0]/w, size[1]/h)
-        new_w, new_h = int(w * ratio), int(h * ratio)
-        if new_w == 0 or new_h == 0:
+        photo, _ = _photo_for(cv2_image, size)
+        if photo is None:
             return
-        img_resized = cv2.resize(cv2_image, (new_w, new_h), interpolation=cv2.INTER_AREA)
-        if len(img_resized.shape) == 2:
-            img_resized = cv2.cvtColor(img_resized, cv2.COLOR_GRAY2BGR)
-        img_rgb = cv2.cvtColor(img_resized, cv2.COLOR_BGR2RGB)
-        photo = ImageTk.PhotoImage(image=Image.fromarray(img_rgb))
         self.image_label.config(image=photo)
         self.image_label.image = photo
 
@@ -3511,19 +4087,18 @@ class GoldPadExtractorTab(tk.Frame):
         min_area_op = self.min_area_open.get()
         
         # imclose - closes small holes
-        close_kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (close_size*2+1, close_size*2+1))
-        mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, close_kernel)
+        mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, _disk_kernel(close_size))
         
         # imopen - removes small noise
-        open_kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (open_size*2+1, open_size*2+1))
-        mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, open_kernel)
+        mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, _disk_kernel(open_size))
         
         # bwareaopen - remove small components
+        # One gather through a per-label 0/255 table instead of a zeroed
+        # mask plus a full-image comparison for every kept component
         num_labels, labels, stats, _ = cv2.connectedComponentsWithStats(mask, connectivity=8)
-        mask_filtered = np.zeros_like(mask)
-        for i in range(1, num_labels):  # Skip background (0)
-            if stats[i, cv2.CC_STAT_AREA] >= min_area_op:
-                mask_filtered[labels == i] = 255
+        keep = np.where(stats[:, cv2.CC_STAT_AREA] >= min_area_op, 255, 0).astype(np.uint8)
+        keep[0] = 0  # Background
+        mask_filtered = keep[labels]
         
         # imfill holes
         mask_filled = mask_filtered.copy()
@@ -3650,7 +4225,7 @@ class GoldPadExtractorTab(tk.Frame):
                 y2 = int(min(h_img, np.ceil(cy + r + pad_val)))
                 
                 # Crop the region
-                crop_img = self.current_image[y1:y2, x1:x2].copy()
+                crop_img = self.current_image[y1:y2, x1:x2]
                 crop_h, crop_w = crop_img.shape[:2]
                 
                 if self.circular_crop.get():
@@ -3663,12 +4238,11 @@ class GoldPadExtractorTab(tk.Frame):
                     dist_sq = (X - local_cx) ** 2 + (Y - local_cy) ** 2
                     alpha = (dist_sq <= r ** 2).astype(np.uint8) * 255
                     
-                    # Add alpha channel to image
-                    b, g, r_ch = cv2.split(crop_img)
-                    crop_with_alpha = cv2.merge([b, g, r_ch, alpha])
+                    # Add alpha channel to image (builds a new array, no copy needed)
+                    crop_with_alpha = np.dstack((crop_img, alpha))
                     self.extracted_pads.append((crop_with_alpha, region))
                 else:
-                    self.extracted_pads.append((crop_img, region))
+                    self.extracted_pads.append((crop_img.copy(), region))
                 
                 # Draw on preview
                 cv2.rectangle(preview, (x1, y1), (x2, y2), (0, 255, 0), 2)
@@ -3698,13 +4272,11 @@ class GoldPadExtractorTab(tk.Frame):
             else:
                 base_name = "Output"
             
-            for i, (pad, region) in enumerate(self.extracted_pads):
-                if self.circular_crop.get():
-                    filename = f"{base_name}_Circle_alpha_{i+1:03d}.png"
-                else:
-                    filename = f"{base_name}_Circle_rect_{i+1:03d}.png"
-                path = os.path.join(folder, filename)
-                cv2.imwrite(path, pad)
+            suffix = "alpha" if self.circular_crop.get() else "rect"
+            _write_pngs([
+                (os.path.join(folder, f"{base_name}_Circle_{suffix}_{i+1:03d}.png"), pad)
+                for i, (pad, region) in enumerate(self.extracted_pads)
+            ])
             
             messagebox.showinfo("Saved", 
                 f"Saved {len(self.extracted_pads)} gold pads to {folder}")
@@ -3713,20 +4285,9 @@ class GoldPadExtractorTab(tk.Frame):
         """Display image in the label."""
         if cv2_image is None:
             return
-        h, w = cv2_image.shape[:2]
-        ratio = min(size[0]/w, size[1]/h)
-        new_w, new_h = int(w * ratio), int(h * ratio)
-        if new_w == 0 or new_h == 0:
+        photo, _ = _photo_for(cv2_image, size)  # drops alpha of BGRA
+        if photo is None:
             return
-        # Handle 4-channel images (BGRA)
-        if len(cv2_image.shape) == 3 and cv2_image.shape[2] == 4:
-            img_resized = cv2.resize(cv2_image[:, :, :3], (new_w, new_h), interpolation=cv2.INTER_AREA)
-        else:
-            img_resized = cv2.resize(cv2_image, (new_w, new_h), interpolation=cv2.INTER_AREA)
-        if len(img_resized.shape) == 2:
-            img_resized = cv2.cvtColor(img_resized, cv2.COLOR_GRAY2BGR)
-        img_rgb = cv2.cvtColor(img_resized, cv2.COLOR_BGR2RGB)
-        photo = ImageTk.PhotoImage(image=Image.fromarray(img_rgb))
         self.image_label.config(image=photo)
         self.image_label.image = photo
 
@@ -3818,17 +4379,16 @@ class RedPadExtractorTab(tk.Frame):
         """Create HSV mask for red regions (dual hue range)."""
         hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
         # Red wraps around, so we need two ranges
-        lower1 = np.array([self.hue_low1.get(), self.sat_low.get(), self.val_low.get()])
-        upper1 = np.array([self.hue_high1.get(), 255, 255])
-        lower2 = np.array([self.hue_low2.get(), self.sat_low.get(), self.val_low.get()])
-        upper2 = np.array([self.hue_high2.get(), 255, 255])
+        lower1 = (self.hue_low1.get(), self.sat_low.get(), self.val_low.get())
+        upper1 = (self.hue_high1.get(), 255, 255)
+        lower2 = (self.hue_low2.get(), self.sat_low.get(), self.val_low.get())
+        upper2 = (self.hue_high2.get(), 255, 255)
         
         mask1 = cv2.inRange(hsv, lower1, upper1)
         mask2 = cv2.inRange(hsv, lower2, upper2)
         mask = cv2.bitwise_or(mask1, mask2)
         
-        kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
-        mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, kernel)
+        mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, _K5_ELLIPSE)
         return mask
     
     def _preview_detection(self):
@@ -3877,25 +4437,19 @@ class RedPadExtractorTab(tk.Frame):
         
         folder = filedialog.askdirectory(title="Select Output Folder")
         if folder:
-            for i, pad in enumerate(self.extracted_pads):
-                path = os.path.join(folder, f"red_pad_{i+1:03d}.png")
-                cv2.imwrite(path, pad)
+            _write_pngs([
+                (os.path.join(folder, f"red_pad_{i+1:03d}.png"), pad)
+                for i, pad in enumerate(self.extracted_pads)
+            ])
             messagebox.showinfo("Saved", f"Saved {len(self.extracted_pads)} red pads to {folder}")
     
     def _display_image(self, cv2_image, size=(500, 400)):
         """Display image in the label."""
         if cv2_image is None:
             return
-        h, w = cv2_image.shape[:2]
-        ratio = min(size[0]/w, size[1]/h)
-        new_w, new_h = int(w * ratio), int(h * ratio)
-        if new_w == 0 or new_h == 0:
+        photo, _ = _photo_for(cv2_image, size)
+        if photo is None:
             return
-        img_resized = cv2.resize(cv2_image, (new_w, new_h), interpolation=cv2.INTER_AREA)
-        if len(img_resized.shape) == 2:
-            img_resized = cv2.cvtColor(img_resized, cv2.COLOR_GRAY2BGR)
-        img_rgb = cv2.cvtColor(img_resized, cv2.COLOR_BGR2RGB)
-        photo = ImageTk.PhotoImage(image=Image.fromarray(img_rgb))
         self.image_label.config(image=photo)
         self.image_label.image = photo
 
@@ -3905,20 +4459,37 @@ class RedPadExtractorTab(tk.Frame):
 # HELPER FUNCTIONS FOR DEFECT DETECTION(Keepable)
 # ==============================================================================
 
-def masked_gaussian_smooth(gray01, mask01, sigma):
-    """Normalized masked Gaussian (avoid boundary bleeding)."""
-    if sigma <= 0:
-        out = gray01.copy()
-        out[mask01 <= 0] = 0.0
-        return out
-
+@lru_cache(maxsize=32)
+def _gaussian_kernel(sigma):
+    """1-D float32 Gaussian of length ~6*sigma (odd, >= 3), cached per sigma."""
     k = int(6 * sigma + 1)
     if k % 2 == 0:
         k += 1
     k = max(k, 3)
+    g = cv2.getGaussianKernel(k, sigma, cv2.CV_32F)
+    g.flags.writeable = False
+    return g
+
+
+def masked_gaussian_smooth(gray01, mask01, sigma, scratch=None):
+    """Normalized masked Gaussian (avoid boundary bleeding).
 
-    num = cv2.GaussianBlur(gray01 * mask01, (k, k), sigmaX=sigma, sigmaY=sigma, borderType=cv2.BORDER_REFLECT)
-    den = cv2.GaussianBlur(mask01, (k, k), sigmaX=sigma, sigmaY=sigma, borderType=cv2.BORDER_REFLECT)
+    ``scratch`` is an optional (packed, blurred) pair of float32 (h, w, 2)
+    buffers that are written into instead of allocating per call.
+    """
+    if sigma <= 0:
+        out = gray01.copy()
+        out[mask01 <= 0] = 0.0
+        return out
+
+    # Numerator and denominator share one separable kernel: pack them as two
+    # channels and filter once instead of running GaussianBlur twice.
+    g = _gaussian_kernel(sigma)
+    packed_dst, blurred_dst = scratch if scratch is not None else (None, None)
+    packed = cv2.merge([gray01 * mask01, mask01], dst=packed_dst)
+    blurred = cv2.sepFilter2D(packed, -1, g, g, dst=blurred_dst,
+                              borderType=cv2.BORDER_REFLECT)
+    num, den = blurred[:, :, 0], blurred[:, :, 1]
     out = num / (den + 1e-8)
     out[mask01 <= 0] = 0.0
     return out
@@ -4049,6 +4620,10 @@ class DefectLabelerWindow(tk.Toplevel):
         self.edited = False
         
         self.orig_h, self.orig_w = rgb_image.shape[:2]
+        # PIL view sharing the array's memory, made once and resized from on
+        # every fit, instead of a fromarray copy per resize
+        self._pil_src = Image.frombuffer("RGB", (self.orig_w, self.orig_h),
+                                         np.ascontiguousarray(rgb_image), "raw", "RGB", 0, 1)
         
         # UI
         self._build_ui()
@@ -4069,6 +4644,8 @@ class DefectLabelerWindow(tk.Toplevel):
         self.scale = 1.0
         self.off_x = 0
         self.off_y = 0
+        self._last_size = (0, 0)  # Canvas size of the last fit
+        self._img_size = None  # Size tk_img was resampled to
         
     def _build_ui(self):
         # Toolbar
@@ -4089,6 +4666,11 @@ class DefectLabelerWindow(tk.Toplevel):
         self.canvas.pack(fill="both", expand=True)
         
     def _on_resize(self, event):
+        # Zoomed startup and moves fire <Configure> without a size change
+        size = (event.width, event.height)
+        if size == self._last_size:
+            return
+        self._last_size = size
         self._refresh_image()
         
     def _refresh_image(self):
@@ -4104,10 +4686,11 @@ class DefectLabelerWindow(tk.Toplevel):
         new_w = int(self.orig_w * self.scale)
         new_h = int(self.orig_h * self.scale)
         
-        # Resize
-        pil = Image.fromarray(self.rgb_image)
-        pil = pil.resize((new_w, new_h), Image.Resampling.LANCZOS)
-        self.tk_img = ImageTk.PhotoImage(pil)
+        # Resize, only when the fitted size changed; label edits just redraw
+        if self._img_size != (new_w, new_h):
+            pil = self._pil_src.resize((new_w, new_h), Image.Resampling.LANCZOS)
+            self.tk_img = ImageTk.PhotoImage(pil)
+            self._img_size = (new_w, new_h)
         
         # Center
         self.off_x = (cw - new_w) // 2
@@ -4458,23 +5041,11 @@ class TextureAnalysisWindow(tk.Toplevel):
         if cw < 10 or ch < 10:
             cw, ch = 400, 400
         
-        ratio = min(cw / w, ch / h)
-        new_w, new_h = int(w * ratio), int(h * ratio)
-        if new_w == 0 or new_h == 0:
+        photo, _ = _photo_for(img, (cw, ch))
+        if photo is None:
             return
         
-        img_resized = cv2.resize(img, (new_w, new_h), interpolation=cv2.INTER_AREA)
-        
-        if len(img_resized.shape) == 2:
-            img_rgb = cv2.cvtColor(img_resized, cv2.COLOR_GRAY2RGB)
-        else:
-            img_rgb = cv2.cvtColor(img_resized, cv2.COLOR_BGR2RGB)
-        
-        photo = ImageTk.PhotoImage(image=Image.fromarray(img_rgb))
-        
-        canvas.delete("all")
-        canvas.create_image(cw // 2, ch // 2, image=photo, anchor=tk.CENTER)
-        canvas.image = photo  # Keep reference
+        _blit_to_canvas(canvas, photo, cw // 2, ch // 2, anchor=tk.CENTER)
 # ==============================================================================
 
 #data aug
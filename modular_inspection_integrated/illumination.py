@@ -4,11 +4,30 @@ Combines V2's comprehensive light handling with preprocessing for robust compari
 """
 import cv2
 import numpy as np
+from functools import lru_cache
 from typing import Tuple, Optional
 
 from .config import LightSensitivityMode, LightSensitivityConfig
 
 
+# Square structuring elements used by close_open_mask, built once
+_K3_RECT = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 3))
+_K5_RECT = cv2.getStructuringElement(cv2.MORPH_RECT, (5, 5))
+_RECT_KERNELS = {3: _K3_RECT, 5: _K5_RECT}
+
+# Saturation x1.2 clipped to 255, truncated as the float32 path did
+_SAT_BOOST_LUT = np.minimum(np.arange(256, dtype=np.float32) * np.float32(1.2),
+                            255).astype(np.uint8)
+
+
+@lru_cache(maxsize=16)
+def _gamma_table(gamma: float) -> np.ndarray:
+    """Read-only uint8 gamma lookup table, built once per gamma value."""
+    table = ((np.arange(256) / 255.0) ** (1.0 / gamma) * 255).astype(np.uint8)
+    table.flags.writeable = False
+    return table
+
+
 def gamma_correction(image: np.ndarray, gamma: float = 1.0) -> np.ndarray:
     """Apply gamma correction to an image.
     
@@ -22,11 +41,7 @@ def gamma_correction(image: np.ndarray, gamma: float = 1.0) -> np.ndarray:
     if gamma == 1.0:
         return image
     
-    inv_gamma = 1.0 / gamma
-    table = np.array([((i / 255.0) ** inv_gamma) * 255 
-                      for i in range(256)]).astype(np.uint8)
-    
-    return cv2.LUT(image, table)
+    return cv2.LUT(image, _gamma_table(gamma))
 
 
 def apply_clahe(image: np.ndarray, clip_limit: float = 2.0, 
@@ -51,6 +66,19 @@ def apply_clahe(image: np.ndarray, clip_limit: float = 2.0,
     return cv2.cvtColor(lab_normalized, cv2.COLOR_LAB2BGR)
 
 
+@lru_cache(maxsize=16)
+def _highlight_lab_table(threshold: int) -> np.ndarray:
+    """Read-only (256, 1, 3) LAB table: compress L above threshold, keep a/b."""
+    l_values = np.arange(256, dtype=np.float32)
+    over = l_values > threshold
+    l_values[over] = threshold + (l_values[over] - threshold) * 0.3
+    
+    table = np.repeat(np.arange(256, dtype=np.uint8)[:, None, None], 3, axis=2)
+    table[:, 0, 0] = np.clip(l_values, 0, 255).astype(np.uint8)
+    table.flags.writeable = False
+    return table
+
+
 def highlight_recovery(image: np.ndarray, threshold: int = 240) -> np.ndarray:
     """Recover detail from overexposed/highlight regions.
     
@@ -61,13 +89,9 @@ def highlight_recovery(image: np.ndarray, threshold: int = 240) -> np.ndarray:
     Returns:
         Image with recovered highlights
     """
+    # The remap only depends on L, so it is baked into a table per threshold
     lab = cv2.cvtColor(image, cv2.COLOR_BGR2LAB)
-    l_channel = lab[:, :, 0].astype(np.float32)
-    
-    highlight_mask = l_channel > threshold
-    l_channel[highlight_mask] = threshold + (l_channel[highlight_mask] - threshold) * 0.3
-    
-    lab[:, :, 0] = np.clip(l_channel, 0, 255).astype(np.uint8)
+    cv2.LUT(lab, _highlight_lab_table(threshold), dst=lab)
     return cv2.cvtColor(lab, cv2.COLOR_LAB2BGR)
 
 
@@ -96,12 +120,37 @@ def hdr_processing(image: np.ndarray,
     return np.clip(result * 255, 0, 255).astype(np.uint8)
 
 
+def close_open_mask(mask: np.ndarray, ksize: int = 5) -> np.ndarray:
+    """Clean a binary mask with a morphological close followed by an open.
+    
+    Same result as MORPH_CLOSE then MORPH_OPEN, but issued as
+    dilate -> erode(x2) -> dilate so the back-to-back erosions collapse into
+    one call, and with a square kernel that OpenCV runs as a separable
+    row/column pass. For mask cleanup the square is an adequate stand-in
+    for the small ellipse used previously.
+    
+    Args:
+        mask: Binary uint8 mask (0/255)
+        ksize: Side length of the square structuring element
+        
+    Returns:
+        Cleaned binary mask
+    """
+    kernel = _RECT_KERNELS.get(ksize)
+    if kernel is None:
+        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (ksize, ksize))
+    dilated = cv2.dilate(mask, kernel)
+    eroded = cv2.erode(dilated, kernel, iterations=2)
+    return cv2.dilate(eroded, kernel, dst=dilated)
+
+
 def gold_pad_hsv_filter(image: np.ndarray, 
                         hue_low: int = 15, hue_high: int = 40,
                         sat_low: int = 50, sat_high: int = 255,
                         val_low: int = 80, val_high: int = 255,
                         enhance_contrast: bool = True,
-                        return_mask: bool = False) -> np.ndarray:
+                        return_mask: bool = False,
+                        mask_scale: float = 1.0) -> np.ndarray:
     """Apply HSV filtering specifically for gold bonding pads.
     
     Gold bonding pads typically appear in yellow-golden colors.
@@ -117,28 +166,42 @@ def gold_pad_hsv_filter(image: np.ndarray,
         val_high: Upper value/brightness bound
         enhance_contrast: Apply CLAHE enhancement to gold regions
         return_mask: If True, return the mask; if False, return enhanced image
+        mask_scale: Compute the mask on an image downscaled by this factor
+            and upsample it with nearest-neighbour (1.0 = full resolution)
         
     Returns:
         Enhanced BGR image with gold regions highlighted, or the mask
     """
+    # The mask boundary is smoothed by morphology anyway, so the HSV
+    # conversion and thresholding can run on fewer pixels.
+    h, w = image.shape[:2]
+    if mask_scale < 1.0 and min(h, w) * mask_scale >= 8:
+        mask_src = cv2.resize(image, None, fx=mask_scale, fy=mask_scale,
+                              interpolation=cv2.INTER_AREA)
+    else:
+        mask_src = image
+    
     # Convert to HSV
-    hsv = cv2.cvtColor(image, cv2.COLOR_BGR2HSV)
+    hsv = cv2.cvtColor(mask_src, cv2.COLOR_BGR2HSV)
     
-    # Create mask for gold color range
-    lower_gold = np.array([hue_low, sat_low, val_low])
-    upper_gold = np.array([hue_high, sat_high, val_high])
-    gold_mask = cv2.inRange(hsv, lower_gold, upper_gold)
+    # Create mask for gold color range (inRange does all six compares
+    # and the ANDs in one pass over the HSV buffer)
+    gold_mask = cv2.inRange(hsv, (hue_low, sat_low, val_low),
+                            (hue_high, sat_high, val_high))
     
     # Clean up mask with morphological operations
-    kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3))
-    gold_mask = cv2.morphologyEx(gold_mask, cv2.MORPH_CLOSE, kernel)
-    gold_mask = cv2.morphologyEx(gold_mask, cv2.MORPH_OPEN, kernel)
+    gold_mask = close_open_mask(gold_mask, 3)
+    
+    if mask_src is not image:
+        gold_mask = cv2.resize(gold_mask, (w, h), interpolation=cv2.INTER_NEAREST)
     
     if return_mask:
         return gold_mask
     
-    # Create enhanced version
+    # Create enhanced version. Everything below only changes gold pixels,
+    # so it works on those alone rather than whole-image passes.
     result = image.copy()
+    gold = gold_mask > 0
     
     if enhance_contrast:
         # Apply CLAHE to enhance contrast in gold regions
@@ -148,26 +211,19 @@ def gold_pad_hsv_filter(image: np.ndarray,
         clahe = cv2.createCLAHE(clipLimit=3.0, tileGridSize=(8, 8))
         l_enhanced = clahe.apply(l_channel)
         
-        # Apply enhancement only in gold regions using mask
-        mask_3ch = cv2.merge([gold_mask, gold_mask, gold_mask])
-        
         lab_enhanced = cv2.merge([l_enhanced, a_channel, b_channel])
         enhanced_bgr = cv2.cvtColor(lab_enhanced, cv2.COLOR_LAB2BGR)
         
-        # Blend enhanced regions with original
-        result = np.where(mask_3ch > 0, enhanced_bgr, image)
-    
-    # Optionally boost saturation in gold regions for visibility
-    hsv_result = cv2.cvtColor(result, cv2.COLOR_BGR2HSV).astype(np.float32)
-    
-    # Boost saturation slightly in gold regions
-    hsv_result[:, :, 1] = np.where(
-        gold_mask > 0,
-        np.clip(hsv_result[:, :, 1] * 1.2, 0, 255),
-        hsv_result[:, :, 1]
-    )
+        # Apply enhancement only in gold regions using mask
+        np.copyto(result, enhanced_bgr, where=gold[:, :, None])
     
-    result = cv2.cvtColor(hsv_result.astype(np.uint8), cv2.COLOR_HSV2BGR)
+    # Boost saturation slightly in gold regions for visibility. Only the
+    # gold pixels are gathered (as an N x 1 image) through the HSV round
+    # trip; the rest of the image is left untouched.
+    if gold.any():
+        hsv_gold = cv2.cvtColor(result[gold][:, None, :], cv2.COLOR_BGR2HSV)
+        hsv_gold[:, 0, 1] = _SAT_BOOST_LUT[hsv_gold[:, 0, 1]]
+        result[gold] = cv2.cvtColor(hsv_gold, cv2.COLOR_HSV2BGR)[:, 0, :]
     
     return result
 
@@ -195,7 +251,8 @@ def get_gold_pad_mask(image: np.ndarray, config: Optional[LightSensitivityConfig
         sat_high=config.gold_saturation_high,
         val_low=config.gold_value_low,
         val_high=config.gold_value_high,
-        return_mask=True
+        return_mask=True,
+        mask_scale=config.gold_mask_scale
     )
 
 
@@ -266,7 +323,8 @@ def apply_light_sensitivity_mode(image: np.ndarray,
             sat_high=config.gold_saturation_high,
             val_low=config.gold_value_low,
             val_high=config.gold_value_high,
-            enhance_contrast=config.gold_enhance_contrast
+            enhance_contrast=config.gold_enhance_contrast,
+            mask_scale=config.gold_mask_scale
         )
         
     else:  # STANDARD
@@ -290,34 +348,23 @@ def match_histograms(source: np.ndarray, reference: np.ndarray) -> np.ndarray:
     source_lab = cv2.cvtColor(source, cv2.COLOR_BGR2LAB)
     reference_lab = cv2.cvtColor(reference, cv2.COLOR_BGR2LAB)
     
-    matched_lab = np.zeros_like(source_lab)
-    
+    # One 3-channel table, applied to all of L, a and b in a single pass
+    lut = np.empty((256, 1, 3), dtype=np.uint8)
     for i in range(3):
-        matched_lab[:, :, i] = _match_channel_histogram(
-            source_lab[:, :, i], 
-            reference_lab[:, :, i]
-        )
+        lut[:, 0, i] = _match_channel_lut(source_lab[:, :, i], reference_lab[:, :, i])
     
-    return cv2.cvtColor(matched_lab, cv2.COLOR_LAB2BGR)
+    return cv2.cvtColor(cv2.LUT(source_lab, lut), cv2.COLOR_LAB2BGR)
 
 
-def _match_channel_histogram(source: np.ndarray, reference: np.ndarray) -> np.ndarray:
-    """Match histogram of a single channel."""
-    src_hist, _ = np.histogram(source.flatten(), 256, [0, 256])
-    ref_hist, _ = np.histogram(reference.flatten(), 256, [0, 256])
-    
-    src_cdf = src_hist.cumsum()
-    ref_cdf = ref_hist.cumsum()
+def _match_channel_lut(source: np.ndarray, reference: np.ndarray) -> np.ndarray:
+    """Lookup table matching the histogram of one uint8 channel to another."""
+    src_cdf = np.bincount(source.ravel(), minlength=256).cumsum()
+    ref_cdf = np.bincount(reference.ravel(), minlength=256).cumsum()
     
     src_cdf = src_cdf / src_cdf[-1]
     ref_cdf = ref_cdf / ref_cdf[-1]
     
-    lookup = np.zeros(256, dtype=np.uint8)
-    for i in range(256):
-        j = np.searchsorted(ref_cdf, src_cdf[i])
-        lookup[i] = min(j, 255)
-    
-    return lookup[source]
+    return np.minimum(np.searchsorted(ref_cdf, src_cdf), 255).astype(np.uint8)
 
 
 def preprocess_pair(master: np.ndarray, test: np.ndarray, 
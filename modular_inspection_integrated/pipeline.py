@@ -6,12 +6,13 @@ import time
 import cv2
 import numpy as np
 import os
+import weakref
 from datetime import datetime
 
 from .io import read_image
 from .align import align_images, align_images_detailed
 from .ssim import calc_ssim
-from .pixel_match import run_pixel_matching, run_pixel_matching_multiscale
+from .pixel_match import run_pixel_matching, run_pixel_matching_multiscale, prepare_gray_pair
 from .edge_detection import run_edge_detection
 from .illumination import apply_light_sensitivity_mode, preprocess_pair
 from .grid_analyzer import GridAnalyzer
@@ -24,6 +25,60 @@ from .config import (
 from .analysis import AnomalyLocationMapper, export_results_as_json
 from .qr_cropper import QRCodeExtractor, get_qr_json
 
+class _GoldenEntry:
+    """Light-preprocessed golden image, with its float32 copy made on first use.
+    
+    Only a weak reference to the source array is held. When the caller
+    drops the golden image, the entry clears itself from the cache.
+    """
+    __slots__ = ("source", "mode", "_proc", "_f32")
+    
+    def __init__(self, golden_image: np.ndarray, mode: LightSensitivityMode, proc: np.ndarray):
+        self.source = weakref.ref(golden_image, self._drop)
+        self.mode = mode
+        # STANDARD mode hands back the input itself; don't pin it here
+        self._proc = None if proc is golden_image else proc
+        self._f32 = None
+    
+    def _drop(self, _ref):
+        global _golden_cache
+        if _golden_cache is self:
+            _golden_cache = None
+    
+    @property
+    def proc(self) -> np.ndarray:
+        return self.source() if self._proc is None else self._proc
+    
+    def as_float32(self) -> np.ndarray:
+        """The processed golden as float32, converted once and kept."""
+        if self._f32 is None:
+            self._f32 = self.proc.astype(np.float32)
+        return self._f32
+
+
+# The golden image from the last run. Batch runs inspect many test images
+# against one golden array, so its light preprocessing (and, for full-size
+# SSIM, float conversion) only need doing once. One entry at most, and it
+# goes away with the golden array or clear_golden_cache().
+_golden_cache = None
+
+
+def clear_golden_cache() -> None:
+    """Drop the cached preprocessed golden image."""
+    global _golden_cache
+    _golden_cache = None
+
+
+def _preprocess_golden(golden_image: np.ndarray, light_mode: LightSensitivityMode,
+                       light_config: LightSensitivityConfig) -> _GoldenEntry:
+    """Light-preprocess the golden image, reusing the last result for the same array."""
+    global _golden_cache
+    entry = _golden_cache
+    if entry is None or entry.source() is not golden_image or entry.mode != light_mode:
+        proc = apply_light_sensitivity_mode(golden_image, light_mode, light_config)
+        entry = _golden_cache = _GoldenEntry(golden_image, light_mode, proc)
+    return entry
+
 
 def run_inspection(
     golden_image: np.ndarray,
@@ -72,14 +127,18 @@ def run_inspection(
         print("[1] Applying light sensitivity mode...")
     
     light_config = LightSensitivityConfig(mode=light_mode)
-    golden_proc = apply_light_sensitivity_mode(golden_image, light_mode, light_config)
+    golden_entry = _preprocess_golden(golden_image, light_mode, light_config)
+    golden_proc = golden_entry.proc
     test_proc = apply_light_sensitivity_mode(test_image, light_mode, light_config)
     
     # -------------------------------------------------------------------------
     # STEP 2: Resize to Match
     # -------------------------------------------------------------------------
     h, w = golden_proc.shape[:2]
-    test_resized = cv2.resize(test_proc, (w, h))
+    if test_proc.shape[:2] == (h, w):
+        test_resized = test_proc  # Same-size captures need no copy
+    else:
+        test_resized = cv2.resize(test_proc, (w, h))
     
     # -------------------------------------------------------------------------
     # STEP 3: Alignment
@@ -91,6 +150,9 @@ def run_inspection(
     aligned_image, (dx, dy), confidence, valid_mask = align_images(
         golden_proc, test_resized, method=alignment_method, config=align_config
     )
+    # Only the aligned copy of the test image is used from here on; drop
+    # the full-size intermediates so they don't add to peak memory
+    del test_proc, test_resized
     
     if verbose:
         print(f"    Translation: dx={dx:.2f}, dy={dy:.2f}")
@@ -110,7 +172,12 @@ def run_inspection(
     if verbose:
         print("[3] Running SSIM structural check...")
     
-    ssim_score, ssim_heatmap = calc_ssim(golden_proc, aligned_image)
+    # Full-size SSIM takes the cached float32 golden; a downscaled one is
+    # cheaper to resize from uint8, so no float copy is made for it
+    ssim_golden = golden_entry.as_float32() if config.ssim.scale >= 1.0 else golden_proc
+    ssim_score, ssim_heatmap = calc_ssim(ssim_golden, aligned_image, scale=config.ssim.scale,
+                                         use_opencl=config.ssim.use_opencl)
+    del ssim_golden, golden_entry
     
     if verbose:
         print(f"    SSIM Score: {ssim_score:.4f} (threshold: {SSIM_PASS_THRESHOLD})")
@@ -118,7 +185,6 @@ def run_inspection(
     if ssim_score > SSIM_PASS_THRESHOLD:
         if verbose:
             print("    >> SSIM PASS - Skipping pixel analysis")
-        
         return {
             'verdict': 'Normal',
             'method': 'SSIM',
@@ -138,14 +204,19 @@ def run_inspection(
     if verbose:
         print("[4] Running pixel matching analysis...")
     
+    # Normalization/CLAHE for pixel matching is only prepared once SSIM has
+    # failed, so the pass path does no post-SSIM work at all
+    gray_pair = prepare_gray_pair(golden_proc, aligned_image,
+                                  normalize_lighting=normalize_lighting,
+                                  normalize_method=normalize_method)
+    
     if use_multi_scale:
         pixel_result = run_pixel_matching_multiscale(
             golden_proc, aligned_image,
             pixel_thresh=PIXEL_DIFF_THRESHOLD,
             count_thresh=COUNT_THRESHOLD,
             valid_area_mask=valid_mask,
-            normalize_lighting=normalize_lighting,
-            normalize_method=normalize_method
+            gray_pair=gray_pair
         )
     else:
         pixel_result = run_pixel_matching(
@@ -153,9 +224,9 @@ def run_inspection(
             pixel_thresh=PIXEL_DIFF_THRESHOLD,
             count_thresh=COUNT_THRESHOLD,
             valid_area_mask=valid_mask,
-            normalize_lighting=normalize_lighting,
-            normalize_method=normalize_method
+            gray_pair=gray_pair
         )
+    del golden_proc
     
     if verbose:
         print(f"    Area Score: {pixel_result['area_score']:.2f}%")
@@ -6,11 +6,90 @@ Combines:
 """
 import cv2
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, List, Tuple
 
 from .illumination import preprocess_pair, equalize_histogram_gray
 
 
+# Final dilation kernel for multi-scale detection
+_K5_ONES = np.ones((5, 5), np.uint8)
+
+
+def _and_into(dst: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """In-place ``dst &= mask`` for same-shape uint8 buffers.
+    
+    Contiguous buffers whose size is a multiple of 8 are ANDed as flat
+    uint64 words (8 pixels per element); anything else falls back to a
+    byte-wise AND.
+    """
+    if (dst.size % 8 == 0 and dst.shape == mask.shape
+            and dst.flags.c_contiguous and mask.flags.c_contiguous):
+        words = dst.reshape(-1).view(np.uint64)
+        np.bitwise_and(words, mask.reshape(-1).view(np.uint64), out=words)
+    else:
+        np.bitwise_and(dst, mask, out=dst)
+    return dst
+
+
+def _combine_masks(mask: Optional[np.ndarray],
+                   valid_area_mask: Optional[np.ndarray]) -> Optional[np.ndarray]:
+    """0/255 intersection of the ROI and valid-area masks, or None if neither is set.
+    
+    Always returns a fresh buffer, so the caller's masks are untouched and
+    the result can be ANDed into in place. When both masks are given their
+    AND is the one allocation; the 0/255 normalization runs over it in place.
+    """
+    if mask is None or valid_area_mask is None:
+        only = mask if mask is not None else valid_area_mask
+        return None if only is None else cv2.compare(only, 0, cv2.CMP_GT)
+    combined = np.bitwise_and(mask, valid_area_mask)
+    return cv2.compare(combined, 0, cv2.CMP_GT, dst=combined)
+
+
+def prepare_gray_pair(
+    golden_image: np.ndarray,
+    aligned_image: np.ndarray,
+    use_histogram_equalization: bool = True,
+    normalize_lighting: bool = True,
+    normalize_method: str = "match_histogram"
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Normalize, grayscale and equalize a golden/aligned pair for matching.
+    
+    This is the preprocessing both pixel matchers start with. It only
+    depends on the two images, so callers may run it themselves (e.g. the
+    pipeline, once SSIM has failed) and pass the result in as ``gray_pair``.
+    
+    Args:
+        golden_image: Reference/golden image (BGR)
+        aligned_image: Aligned test image (BGR)
+        use_histogram_equalization: Apply CLAHE to both grayscale images
+        normalize_lighting: Apply illumination normalization (V2)
+        normalize_method: Method for normalization (V2)
+        
+    Returns:
+        Tuple of (golden_gray, aligned_gray) uint8 images
+    """
+    # Apply illumination normalization (V2 feature)
+    if normalize_lighting:
+        golden_processed, aligned_processed = preprocess_pair(
+            golden_image, aligned_image, method=normalize_method
+        )
+    else:
+        golden_processed, aligned_processed = golden_image, aligned_image
+    
+    # Convert to grayscale
+    golden_gray = cv2.cvtColor(golden_processed, cv2.COLOR_BGR2GRAY)
+    aligned_gray = cv2.cvtColor(aligned_processed, cv2.COLOR_BGR2GRAY)
+    
+    # Apply CLAHE histogram equalization (V1 feature)
+    if use_histogram_equalization:
+        golden_gray = equalize_histogram_gray(golden_gray)
+        aligned_gray = equalize_histogram_gray(aligned_gray)
+    
+    return golden_gray, aligned_gray
+
+
 def run_pixel_matching(
     golden_image: np.ndarray, 
     aligned_image: np.ndarray, 
@@ -24,7 +103,8 @@ def run_pixel_matching(
     use_histogram_equalization: bool = True,
     normalize_lighting: bool = True,
     normalize_method: str = "match_histogram",
-    kernel_size: Tuple[int, int] = (5, 5)
+    kernel_size: Tuple[int, int] = (5, 5),
+    gray_pair: Optional[Tuple[np.ndarray, np.ndarray]] = None
 ) -> dict:
     """Run pixel-based anomaly detection and return results dict.
     
@@ -44,6 +124,8 @@ def run_pixel_matching(
         normalize_lighting: Apply illumination normalization (V2)
         normalize_method: Method for normalization (V2)
         kernel_size: Morphological kernel size
+        gray_pair: Output of prepare_gray_pair() for these images, if
+            already computed; the preprocessing options are then unused
 
     Returns dict keys: 
         - area_score: Percentage of anomalous pixels
@@ -58,43 +140,22 @@ def run_pixel_matching(
         - valid_pixel_count: Number of valid pixels analyzed
         - preprocessing_applied: Whether normalization was applied
     """
-    # Apply illumination normalization (V2 feature)
-    if normalize_lighting:
-        golden_processed, aligned_processed = preprocess_pair(
-            golden_image, aligned_image, method=normalize_method
-        )
-    else:
-        golden_processed, aligned_processed = golden_image, aligned_image
-    
-    # Convert to grayscale
-    golden_gray = cv2.cvtColor(golden_processed, cv2.COLOR_BGR2GRAY)
-    aligned_gray = cv2.cvtColor(aligned_processed, cv2.COLOR_BGR2GRAY)
-    
-    # Apply CLAHE histogram equalization (V1 feature)
-    if use_histogram_equalization:
-        golden_gray = equalize_histogram_gray(golden_gray)
-        aligned_gray = equalize_histogram_gray(aligned_gray)
+    if gray_pair is None:
+        gray_pair = prepare_gray_pair(golden_image, aligned_image, use_histogram_equalization,
+                                      normalize_lighting, normalize_method)
+    golden_gray, aligned_gray = gray_pair
     
     # Compute absolute difference
+    # absdiff of uint8 is already uint8 (no convertScaleAbs needed); blur in place
     diff = cv2.absdiff(golden_gray, aligned_gray)
-    diff = cv2.convertScaleAbs(diff)
-    diff = cv2.GaussianBlur(diff, (5, 5), 0)
+    cv2.GaussianBlur(diff, (5, 5), 0, dst=diff)
 
 
-    # Combine masks: ROI mask + valid area mask from alignment
-    combined_mask = None
-    if mask is not None:
-        combined_mask = mask.copy()
-    
-    if valid_area_mask is not None:
-        if combined_mask is not None:
-            combined_mask = cv2.bitwise_and(combined_mask, valid_area_mask)
-        else:
-            combined_mask = valid_area_mask
-    
-    # Apply combined mask
+    # Combine masks: ROI mask + valid area mask from alignment. Normalized
+    # to 0/255 so both masking steps can be in-place ANDs.
+    combined_mask = _combine_masks(mask, valid_area_mask)
     if combined_mask is not None:
-        diff = cv2.bitwise_and(diff, diff, mask=combined_mask)
+        _and_into(diff, combined_mask)
 
     # Thresholding
     if use_adaptive_threshold:
@@ -117,7 +178,7 @@ def run_pixel_matching(
     
     # Apply mask again
     if combined_mask is not None:
-        dilated = cv2.bitwise_and(dilated, dilated, mask=combined_mask)
+        _and_into(dilated, combined_mask)
     
     # Find contours
     contours, _ = cv2.findContours(dilated, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
@@ -186,7 +247,8 @@ def run_pixel_matching_multiscale(
     scales: List[Tuple[int, int]] = [(3, 3), (5, 5), (9, 9)],
     use_histogram_equalization: bool = True,
     normalize_lighting: bool = True,
-    normalize_method: str = "match_histogram"
+    normalize_method: str = "match_histogram",
+    gray_pair: Optional[Tuple[np.ndarray, np.ndarray]] = None
 ) -> dict:
     """Run multi-scale detection for different defect sizes (V1 feature).
     
@@ -206,61 +268,46 @@ def run_pixel_matching_multiscale(
         use_histogram_equalization: Apply CLAHE before detection
         normalize_lighting: Apply illumination normalization
         normalize_method: Normalization method
+        gray_pair: Output of prepare_gray_pair() for these images, if
+            already computed
         
     Returns:
         Same dict structure as run_pixel_matching()
     """
-    # Preprocessing
-    if normalize_lighting:
-        golden_processed, aligned_processed = preprocess_pair(
-            golden_image, aligned_image, method=normalize_method
-        )
-    else:
-        golden_processed, aligned_processed = golden_image, aligned_image
-    
-    golden_gray = cv2.cvtColor(golden_processed, cv2.COLOR_BGR2GRAY)
-    aligned_gray = cv2.cvtColor(aligned_processed, cv2.COLOR_BGR2GRAY)
-    
-    if use_histogram_equalization:
-        golden_gray = equalize_histogram_gray(golden_gray)
-        aligned_gray = equalize_histogram_gray(aligned_gray)
+    if gray_pair is None:
+        gray_pair = prepare_gray_pair(golden_image, aligned_image, use_histogram_equalization,
+                                      normalize_lighting, normalize_method)
+    golden_gray, aligned_gray = gray_pair
     
     diff = cv2.absdiff(golden_gray, aligned_gray)
     
     # Combine masks
-    combined_mask = None
-    if mask is not None:
-        combined_mask = mask.copy()
-    if valid_area_mask is not None:
-        if combined_mask is not None:
-            combined_mask = cv2.bitwise_and(combined_mask, valid_area_mask)
-        else:
-            combined_mask = valid_area_mask
-    
+    combined_mask = _combine_masks(mask, valid_area_mask)
     if combined_mask is not None:
-        diff = cv2.bitwise_and(diff, diff, mask=combined_mask)
+        _and_into(diff, combined_mask)
     
-    # Multi-scale detection
-    combined_anomaly_mask = None
+    # Multi-scale detection. The threshold doesn't depend on the scale, so
+    # it's done once; the per-scale open/close passes are independent and
+    # OpenCV releases the GIL, so they run side by side.
+    _, thresh = cv2.threshold(diff, pixel_thresh, 255, cv2.THRESH_BINARY)
     
-    for kernel_size in scales:
+    def open_close(kernel_size):
         kernel = np.ones(kernel_size, np.uint8)
-        
-        _, thresh = cv2.threshold(diff, pixel_thresh, 255, cv2.THRESH_BINARY)
         opening = cv2.morphologyEx(thresh, cv2.MORPH_OPEN, kernel)
-        closing = cv2.morphologyEx(opening, cv2.MORPH_CLOSE, kernel)
-        
-        if combined_anomaly_mask is None:
-            combined_anomaly_mask = closing
-        else:
-            combined_anomaly_mask = cv2.bitwise_or(combined_anomaly_mask, closing)
+        return cv2.morphologyEx(opening, cv2.MORPH_CLOSE, kernel)
+    
+    with ThreadPoolExecutor(max_workers=max(1, len(scales))) as pool:
+        closings = list(pool.map(open_close, scales))
+    
+    combined_anomaly_mask = closings[0]
+    for closing in closings[1:]:
+        cv2.bitwise_or(combined_anomaly_mask, closing, dst=combined_anomaly_mask)
     
     # Final dilation
-    final_kernel = np.ones((5, 5), np.uint8)
-    dilated = cv2.dilate(combined_anomaly_mask, final_kernel, iterations=1)
+    dilated = cv2.dilate(combined_anomaly_mask, _K5_ONES, iterations=1)
     
     if combined_mask is not None:
-        dilated = cv2.bitwise_and(dilated, dilated, mask=combined_mask)
+        _and_into(dilated, combined_mask)
     
     # Find contours
     contours, _ = cv2.findContours(dilated, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
@@ -11,20 +11,41 @@ import cv2
 import numpy as np
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Tuple, Optional, Dict
 from datetime import datetime
 
+from .io import write_encoded
+
+# Crop encoders by output_format: (extension, imencode params). PNG keeps
+# OpenCV's default zlib settings (the fastest to encode); JPEG at 92 keeps
+# the modules crisp enough to re-decode.
+_CROP_ENCODINGS = {
+    "PNG": (".png", []),
+    "JPEG": (".jpg", [cv2.IMWRITE_JPEG_QUALITY, 92]),
+}
+
 
 class QRCodeExtractor:
     """Extracts and crops QR codes from images."""
     
-    def __init__(self, output_dir: str = "qrcode_extraction"):
+    def __init__(self, output_dir: str = "qrcode_extraction",
+                 detect_max_dim: Optional[int] = None,
+                 output_format: str = "PNG"):
         """Initialize QR code extractor.
         
         Args:
             output_dir: Directory to save extracted QR codes
+            output_format: "PNG" (lossless) or "JPEG" (much faster to
+                encode; crops have no alpha) for saved crops
+            detect_max_dim: If set, images whose longer side exceeds this
+                are detected on a downscaled copy and the coordinates mapped
+                back to full resolution. Faster on large images, but very
+                small QR codes may be missed.
         """
         self.output_dir = output_dir
+        self.detect_max_dim = detect_max_dim
+        self.output_format = output_format
         self.detector = cv2.QRCodeDetector()
         self.last_results = []
         self.last_json_path = None
@@ -47,11 +68,12 @@ class QRCodeExtractor:
         """
         versions = []
         
-        # Convert to grayscale
+        # Convert to grayscale (the only color conversion per detection; no
+        # version is modified in place, so a gray input is used as is)
         if len(image.shape) == 3:
             gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
         else:
-            gray = image.copy()
+            gray = image
         
         # Version 1: Original grayscale
         versions.append(gray)
@@ -83,10 +105,13 @@ class QRCodeExtractor:
             versions.append(green_binary)
         
         # Version 7: High contrast stretch
-        min_val, max_val = gray.min(), gray.max()
+        # Same values as the float formula, through a 256-entry table rather
+        # than float64 temporaries the size of the image
+        min_val, max_val, _, _ = cv2.minMaxLoc(gray)
         if max_val > min_val:
-            stretched = ((gray - min_val) / (max_val - min_val) * 255).astype(np.uint8)
-            versions.append(stretched)
+            levels = (np.arange(256) - min_val) / (max_val - min_val) * 255
+            stretch_lut = np.clip(levels, 0, 255).astype(np.uint8)
+            versions.append(cv2.LUT(gray, stretch_lut))
         
         return versions
     
@@ -95,6 +120,8 @@ class QRCodeExtractor:
         
         Uses pyzbar as primary method (more reliable), OpenCV as fallback.
         Tries multiple preprocessing versions to maximize detection.
+        With detect_max_dim set, large images are searched at reduced size;
+        the returned coordinates are always in full-resolution pixels.
         
         Args:
             image: BGR image array
@@ -107,6 +134,28 @@ class QRCodeExtractor:
         if image is None or image.size == 0:
             return []
         
+        scale = 1.0
+        if self.detect_max_dim:
+            scale = min(1.0, self.detect_max_dim / max(image.shape[:2]))
+        if scale >= 1.0:
+            return self._detect_and_decode(image)
+        
+        # Every preprocessing version and decoder pass scales with pixel count
+        thumb = cv2.resize(image, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        results = self._detect_and_decode(thumb)
+        inv = 1.0 / scale
+        for qr_info in results:
+            x, y, w, h = qr_info['bbox']
+            qr_info['bbox'] = (int(x * inv), int(y * inv), int(round(w * inv)), int(round(h * inv)))
+            cx, cy = qr_info['center']
+            qr_info['center'] = (int(cx * inv), int(cy * inv))
+            qr_info['points'] = [(int(px * inv), int(py * inv)) for px, py in qr_info['points']]
+        return results
+    
+    def _detect_and_decode(self, image: np.ndarray) -> List[Dict]:
+        """detect_and_decode on the image as given (no downscaling)."""
+        self.last_results = []
+        
         # Generate preprocessed versions
         preprocessed_versions = self._preprocess_for_pcb(image)
         
@@ -232,9 +281,15 @@ class QRCodeExtractor:
         self.last_results = results
         return results
     
-    def crop_qr_codes(self, image: np.ndarray, padding: int = 10) -> List[Tuple[np.ndarray, Dict]]:
-        """Crop all detected QR codes from image."""
-        results = self.detect_and_decode(image)
+    def crop_qr_codes(self, image: np.ndarray, padding: int = 10,
+                      results: Optional[List[Dict]] = None) -> List[Tuple[np.ndarray, Dict]]:
+        """Crop all detected QR codes from image.
+        
+        Pass ``results`` from an earlier detect_and_decode of the same image
+        to skip detecting again.
+        """
+        if results is None:
+            results = self.detect_and_decode(image)
         crops = []
         
         h, w = image.shape[:2]
@@ -253,19 +308,28 @@ class QRCodeExtractor:
         return crops
     
     def save_cropped_qr(self, image: np.ndarray, prefix: str = "qr", 
-                        save_json: bool = True) -> List[str]:
+                        save_json: bool = True,
+                        results: Optional[List[Dict]] = None) -> List[str]:
         """Detect, crop, and save all QR codes from image.
         
         Args:
             image: BGR image array
             prefix: Filename prefix for saved crops
             save_json: Whether to save results as JSON
+            results: Detection results for this image from an earlier
+                detect_and_decode; detected afresh if None
             
         Returns:
             List of saved file paths
+            
+        Raises:
+            IOError: If a crop could not be encoded
         """
-        crops = self.crop_qr_codes(image)
+        crops = self.crop_qr_codes(image, results=results)
         saved_paths = []
+        jobs = []
+        ext, write_params = _CROP_ENCODINGS[self.output_format]
+        os.makedirs(self.output_dir, exist_ok=True)
         
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
@@ -281,10 +345,10 @@ class QRCodeExtractor:
             # Clean data for filename
             data_clean = ''.join(c if c.isalnum() else '_' for c in qr_info['data'][:20])
             
-            filename = f"{prefix}_{timestamp}_{qr_id}_{data_clean}.png"
+            filename = f"{prefix}_{timestamp}_{qr_id}_{data_clean}{ext}"
             filepath = os.path.join(self.output_dir, filename)
             
-            cv2.imwrite(filepath, crop_img)
+            jobs.append((filepath, crop_img))
             saved_paths.append(filepath)
             
             # Add to JSON
@@ -306,6 +370,16 @@ class QRCodeExtractor:
                 'image_file': filename
             })
         
+        # Encoders release the GIL, so the crops encode in parallel. A crop
+        # that fails to encode aborts the save before the JSON claims it.
+        if jobs:
+            with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 4)) as ex:
+                futures = [(path, ex.submit(write_encoded, path, crop, ext, write_params))
+                           for path, crop in jobs]
+                for path, fut in futures:
+                    if not fut.result():
+                        raise IOError(f"Failed to write {path}")
+        
         # Save JSON file
         if save_json and crops:
             json_filename = f"{prefix}_{timestamp}_results.json"
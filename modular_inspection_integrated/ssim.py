@@ -1,17 +1,118 @@
 """SSIM wrapper for the inspection pipeline."""
 import cv2
 import numpy as np
-from skimage.metrics import structural_similarity
 
 
-def calc_ssim(image1: np.ndarray, image2: np.ndarray) -> tuple:
+# skimage.metrics.structural_similarity defaults for uint8 input
+_SSIM_WIN = 7
+_SSIM_C1 = (0.01 * 255) ** 2
+_SSIM_C2 = (0.03 * 255) ** 2
+
+
+def _window_mean(a):
+    """Mean over the SSIM window around each pixel (ndarray or UMat)."""
+    return cv2.boxFilter(a, -1, (_SSIM_WIN, _SSIM_WIN), borderType=cv2.BORDER_REFLECT)
+
+
+def _window_mean_sq(a):
+    """Mean of squares over the SSIM window, without materializing ``a * a``.
+    
+    ddepth is explicit: with -1, sqrBoxFilter widens float32 input to
+    float64, which breaks the mixed-type arithmetic in the UMat path.
+    """
+    return cv2.sqrBoxFilter(a, cv2.CV_32F, (_SSIM_WIN, _SSIM_WIN), borderType=cv2.BORDER_REFLECT)
+
+
+def _ssim_map(image1: np.ndarray, image2: np.ndarray) -> np.ndarray:
+    """Per-pixel, per-channel SSIM of two same-sized uint8 images.
+    
+    Same definition as skimage's structural_similarity defaults (7x7
+    uniform window, sample covariance, reflected borders), but the local
+    window statistics come from cv2.boxFilter over all channels at once
+    rather than one scipy uniform_filter pass per channel and moment.
+    
+    Works in float32 and combines the moments in place, so the per-pixel
+    SSIM expression allocates no full-size temporaries beyond the five
+    window means. float32 inputs (0-255 range) are used without a copy.
+    """
+    if min(image1.shape[:2]) < _SSIM_WIN:
+        raise ValueError(f"SSIM needs images of at least {_SSIM_WIN}x{_SSIM_WIN} pixels")
+    
+    x = image1.astype(np.float32, copy=False)
+    y = image2.astype(np.float32, copy=False)
+    ux, uy = _window_mean(x), _window_mean(y)
+    uxx, uyy = _window_mean_sq(x), _window_mean_sq(y)
+    uxy = _window_mean(x * y)
+    del x, y
+    
+    n = _SSIM_WIN * _SSIM_WIN
+    cov_norm = np.float32(n / (n - 1))
+    
+    num = ux * uy                      # ux*uy
+    ux *= ux                           # ux^2
+    uy *= uy                           # uy^2
+    uxy -= num                         # a2 = 2*cov(x,y) + C2
+    uxy *= 2 * cov_norm
+    uxy += _SSIM_C2
+    num *= 2                           # a1 = 2*ux*uy + C1
+    num += _SSIM_C1
+    num *= uxy
+    uxx += uyy                         # b2 = var(x) + var(y) + C2
+    uxx -= ux
+    uxx -= uy
+    uxx *= cov_norm
+    uxx += _SSIM_C2
+    ux += uy                           # b1 = ux^2 + uy^2 + C1
+    ux += _SSIM_C1
+    ux *= uxx
+    num /= ux
+    return num
+
+
+def _ssim_map_opencl(image1: np.ndarray, image2: np.ndarray) -> np.ndarray:
+    """_ssim_map evaluated on cv2.UMat buffers via OpenCV's transparent API.
+    
+    Every step is an OpenCV call, so with an OpenCL device the window
+    filters and the per-pixel expression run on it and only the final
+    map is downloaded.
+    """
+    if min(image1.shape[:2]) < _SSIM_WIN:
+        raise ValueError(f"SSIM needs images of at least {_SSIM_WIN}x{_SSIM_WIN} pixels")
+    
+    x = cv2.UMat(image1.astype(np.float32, copy=False))
+    y = cv2.UMat(image2.astype(np.float32, copy=False))
+    ux, uy = _window_mean(x), _window_mean(y)
+    uxx, uyy = _window_mean_sq(x), _window_mean_sq(y)
+    uxy = _window_mean(cv2.multiply(x, y))
+    
+    n = _SSIM_WIN * _SSIM_WIN
+    cov_norm = n / (n - 1)
+    
+    uxuy = cv2.multiply(ux, uy)
+    ux2 = cv2.multiply(ux, ux)
+    uy2 = cv2.multiply(uy, uy)
+    a1 = cv2.addWeighted(uxuy, 2.0, uxuy, 0.0, _SSIM_C1)
+    a2 = cv2.addWeighted(uxy, 2 * cov_norm, uxuy, -2 * cov_norm, _SSIM_C2)
+    b1 = cv2.addWeighted(ux2, 1.0, uy2, 1.0, _SSIM_C1)
+    b2 = cv2.subtract(cv2.addWeighted(uxx, cov_norm, uyy, cov_norm, _SSIM_C2),
+                      cv2.addWeighted(ux2, cov_norm, uy2, cov_norm, 0.0))
+    return cv2.divide(cv2.multiply(a1, a2), cv2.multiply(b1, b2)).get()
+
+
+def calc_ssim(image1: np.ndarray, image2: np.ndarray, scale: float = 1.0,
+              use_opencl: bool = False) -> tuple:
     """Compute SSIM between two images (assumes BGR arrays).
 
     Ensures images are same size by resizing image2 to image1 if necessary.
     
     Args:
-        image1: First image (BGR)
-        image2: Second image (BGR)
+        image1: First image (BGR), uint8 or float32 with the same 0-255
+            range; float32 input skips the per-call conversion
+        image2: Second image (BGR), same dtype rules as image1
+        scale: Compute SSIM on both images downscaled by this factor and
+            upsample the heatmap back (faster; the score is approximate)
+        use_opencl: Compute the SSIM map through cv2.UMat when OpenCV
+            reports an OpenCL device; ignored otherwise
         
     Returns:
         Tuple of (score, heatmap):
@@ -26,8 +127,19 @@ def calc_ssim(image1: np.ndarray, image2: np.ndarray) -> tuple:
     if (h1, w1) != (h2, w2):
         image2 = cv2.resize(image2, (w1, h1))
 
-    # structural_similarity with full=True returns the SSIM map
-    score, diff = structural_similarity(image1, image2, full=True, channel_axis=-1)
+    # SSIM cost scales with pixel count; 0.5 does a quarter of the work
+    downscaled = scale < 1.0 and min(h1, w1) * scale >= 16
+    if downscaled:
+        image1 = cv2.resize(image1, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+        image2 = cv2.resize(image2, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+
+    if use_opencl and cv2.ocl.haveOpenCL() and cv2.ocl.useOpenCL():
+        diff = _ssim_map_opencl(image1, image2)
+    else:
+        diff = _ssim_map(image1, image2)
+    # Score excludes the border half-window, matching skimage
+    pad = (_SSIM_WIN - 1) // 2
+    score = diff[pad:-pad, pad:-pad].mean()
     
     # Average across channels if multichannel
     if diff.ndim == 3:
@@ -43,4 +155,7 @@ def calc_ssim(image1: np.ndarray, image2: np.ndarray) -> tuple:
     anomaly_map_uint8 = (anomaly_map * 255).astype(np.uint8)
     heatmap = cv2.applyColorMap(anomaly_map_uint8, cv2.COLORMAP_JET)
     
+    if downscaled:
+        heatmap = cv2.resize(heatmap, (w1, h1), interpolation=cv2.INTER_LINEAR)
+    
     return float(score), heatmap
@@ -182,7 +182,11 @@ def run_batch_inspection_cli(input_dir: str, output_dir: str, golden_path: str =
                 elif verdict == 'Anomaly':
                     anomalies_count += 1
                     if 'contour_map' in result:
-                        cv2.imwrite(os.path.join(defect_dir, f"annotated_{fname}"), result['contour_map'])
+                        # Annotated maps are for viewing only: JPEG encodes far
+                        # faster than PNG deflate and is much smaller on disk.
+                        stem = os.path.splitext(fname)[0]
+                        cv2.imwrite(os.path.join(defect_dir, f"annotated_{stem}.jpg"),
+                                    result['contour_map'], [cv2.IMWRITE_JPEG_QUALITY, 90])
                     shutil.copy2(img_path, os.path.join(defect_dir, fname))
                     print(" DEFECT")
                 else:
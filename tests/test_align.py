@@ -0,0 +1,71 @@
+"""Tests for ECC alignment."""
+import numpy as np
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+
+from modular_inspection_integrated.align import _align_ecc
+from modular_inspection_integrated.config import AlignmentConfig
+
+
+def _shifted_pair(dx=3.4, dy=-2.2, shape=(480, 640)):
+    """Blurred random rectangles and a sub-pixel shifted copy."""
+    rng = np.random.default_rng(1)
+    h, w = shape
+    img = np.zeros((h, w, 3), np.uint8)
+    for _ in range(60):
+        x, y = int(rng.integers(0, w - 40)), int(rng.integers(0, h - 40))
+        bw, bh = (int(v) for v in rng.integers(10, 60, 2))
+        color = tuple(int(c) for c in rng.integers(50, 255, 3))
+        cv2.rectangle(img, (x, y), (x + bw, y + bh), color, -1)
+    img = cv2.GaussianBlur(img, (5, 5), 0)
+    test = cv2.warpAffine(img, np.float32([[1, 0, dx], [0, 1, dy]]), (w, h))
+    return img, test
+
+
+def test_pyramid_is_opt_in():
+    assert AlignmentConfig().ecc_pyramid_levels == 0
+
+
+@pytest.fixture
+def ecc_criteria(monkeypatch):
+    """Record the termination criteria of every findTransformECC call."""
+    calls = []
+    real = cv2.findTransformECC
+
+    def recording(template, image, warp, mode, criteria, *args, **kwargs):
+        calls.append((template.shape, criteria))
+        return real(template, image, warp, mode, criteria, *args, **kwargs)
+
+    monkeypatch.setattr(cv2, "findTransformECC", recording)
+    return calls
+
+
+@pytest.mark.parametrize("motion", ["translation", "euclidean", "affine"])
+def test_pyramid_ecc_is_bounded_and_accurate(motion, ecc_criteria):
+    # Before the coarse/refine caps, seeded levels ran all 5000 iterations
+    # at eps 1e-10 and this took tens of seconds per motion type
+    golden, test = _shifted_pair()
+    config = AlignmentConfig(ecc_motion_type=motion, ecc_pyramid_levels=2)
+    _, (dx, dy), cc, _ = _align_ecc(golden, test, config)
+
+    shapes = [shape for shape, _ in ecc_criteria]
+    assert shapes == [(120, 160), (240, 320), (480, 640)]
+    (_, coarse_iters, coarse_eps), = {c for _, c in ecc_criteria[:-1]}
+    _, full_iters, full_eps = ecc_criteria[-1][1]
+    assert coarse_iters == config.ecc_pyramid_max_iterations
+    assert coarse_eps == config.ecc_pyramid_epsilon
+    assert full_iters == config.ecc_pyramid_max_iterations < config.ecc_max_iterations
+    assert full_eps == config.ecc_epsilon
+
+    assert dx == pytest.approx(3.4, abs=0.05)
+    assert dy == pytest.approx(-2.2, abs=0.05)
+    assert cc > 0.99
+
+
+def test_full_res_only_keeps_configured_criteria(ecc_criteria):
+    golden, test = _shifted_pair()
+    config = AlignmentConfig(ecc_motion_type="translation", ecc_max_iterations=200)
+    _align_ecc(golden, test, config)
+    assert [c for _, c in ecc_criteria] == [
+        (cv2.TERM_CRITERIA_EPS | cv2.TERM_CRITERIA_COUNT, 200, config.ecc_epsilon)]
@@ -0,0 +1,152 @@
+"""Tests that the InspectorApp binarization runs on snapshot values only."""
+import sys
+import threading
+import tkinter as tk
+import types
+
+import numpy as np
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+pytest.importorskip("PIL.ImageTk")
+
+# gui imports the Roboflow client at module level; none of these tests
+# reach it, so stand in for the SDK where it isn't installed
+try:
+    import inference_sdk  # noqa: F401
+except ImportError:
+    _sdk = types.ModuleType("inference_sdk")
+    _sdk.InferenceHTTPClient = object
+    sys.modules["inference_sdk"] = _sdk
+
+from modular_inspection_integrated.gui import InspectorApp
+
+
+class _NoTkVars:
+    """Stand-in for the app: methods resolve, any other state (Tk vars) fails."""
+
+    def __init__(self):
+        self._filter_method = "Gaussian"
+        self._gb_scratch = threading.local()
+
+    def __getattr__(self, name):
+        attr = getattr(InspectorApp, name, None)
+        if callable(attr) and not isinstance(attr, type):
+            return attr.__get__(self)
+        raise AssertionError(f"worker read self.{name}")
+
+
+class _Var:
+    def __init__(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+class _Settings:
+    """Stand-in for the app's Tk variables, for the snapshot taken on the Tk thread."""
+
+    def __init__(self, **values):
+        for name, value in values.items():
+            setattr(self, name, _Var(value))
+
+    def __getattr__(self, name):
+        return getattr(InspectorApp, name).__get__(self)
+
+
+def _rgb(seed=0, shape=(48, 64, 3)):
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, 256, shape, dtype=np.uint8)
+
+
+@pytest.mark.parametrize("use_clahe", [False, True])
+def test_make_binary_uses_only_snapshot(use_clahe):
+    bounds = ((0, 0, 0), (179, 255, 255))
+    result = InspectorApp._make_binary(
+        _NoTkVars(), _rgb(), None,
+        use_hsv=True, use_clahe=use_clahe, hsv_bounds=bounds)
+    bw = result[2]
+    assert bw.dtype == np.uint8
+    assert bw.shape == (48, 64)
+
+
+def test_hsv_mask_follows_bounds():
+    rgb = _rgb()
+    keep_all = InspectorApp._get_hsv_mask(_NoTkVars(), rgb, ((0, 0, 0), (179, 255, 255)))
+    keep_none = InspectorApp._get_hsv_mask(_NoTkVars(), rgb, ((0, 0, 0), (0, 0, 0)))
+    assert keep_all.all()
+    assert not keep_none.any()
+
+
+def test_binary_params_snapshots_hsv_bounds():
+    app = _Settings(sigma=1.5, thresh=0.6, use_adaptive=False, adaptive_block_size=11,
+                    adaptive_c=2, use_hsv=True, use_clahe=True,
+                    hue_min=10, sat_min=20, val_min=30, hue_max=40, sat_max=50, val_max=60)
+    params = InspectorApp._binary_params(app)
+    assert params["hsv_bounds"] == ((10, 20, 30), (40, 50, 60))
+    app.hue_min.value = 99  # Later slider moves don't reach a queued worker
+    assert params["hsv_bounds"][0] == (10, 20, 30)
+
+
+@pytest.mark.parametrize("error", [RuntimeError, tk.TclError])
+def test_post_ignores_closed_window(error):
+    class _Closed:
+        def after(self, *args):
+            raise error("main thread is not in main loop")
+
+    InspectorApp._post(_Closed(), print, "never shown")
+
+
+def test_post_schedules_on_tk_thread():
+    calls = []
+
+    class _Open:
+        def after(self, delay, callback, *args):
+            calls.append((delay, callback, args))
+
+    InspectorApp._post(_Open(), print, "x")
+    assert calls == [(0, print, ("x",))]
+
+
+def test_make_binary_applies_clahe_flag():
+    rng = np.random.default_rng(1)
+    gray = cv2.GaussianBlur(rng.integers(100, 130, (48, 64), dtype=np.uint8), (5, 5), 0)
+    rgb = np.dstack([gray] * 3)
+    plain = InspectorApp._make_binary(_NoTkVars(), rgb, None, use_clahe=False)[0]
+    equalized = InspectorApp._make_binary(_NoTkVars(), rgb, None, use_clahe=True)[0]
+    np.testing.assert_array_equal(plain, gray)
+    assert equalized.std() > 2 * plain.std()
+
+
+def _quick_app(files):
+    app = _Settings(sigma=1.2, thresh=0.65, use_adaptive=False, adaptive_block_size=11,
+                    adaptive_c=2, use_hsv=False, use_clahe=False, black_defect_pct=10.0,
+                    hue_min=0, sat_min=0, val_min=0, hue_max=179, sat_max=255, val_max=255)
+    app.files = files
+    app._filter_method = "Gaussian"
+    app._gb_scratch = threading.local()
+    return app
+
+
+def test_quick_process_records_unreadable_images(tmp_path):
+    good = tmp_path / "good.png"
+    cv2.imwrite(str(good), _rgb())
+    bad = tmp_path / "bad.png"
+    bad.write_bytes(b"not a png")
+    app = _quick_app([str(good), str(bad)])
+    InspectorApp._quick_process(app)
+    assert app.results[1]["status"] == "ERROR"
+    assert app.results[0]["status"] in ("OK", "DEFECT")
+
+
+def test_quick_process_lets_bugs_propagate(tmp_path, monkeypatch):
+    good = tmp_path / "good.png"
+    cv2.imwrite(str(good), _rgb())
+
+    def broken(self, bw, mask_bool):
+        raise TypeError("bug")
+
+    monkeypatch.setattr(InspectorApp, "_compute_stats", broken)
+    with pytest.raises(TypeError):
+        InspectorApp._quick_process(_quick_app([str(good)]))
@@ -0,0 +1,15 @@
+"""Tests for the image I/O helpers."""
+import numpy as np
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+
+from modular_inspection_integrated.io import read_image, write_encoded
+
+
+def test_write_encoded_round_trips_non_ascii_path(tmp_path):
+    img = np.random.default_rng(0).integers(0, 256, (20, 30, 3), dtype=np.uint8)
+    path = str(tmp_path / "ครอป.png")
+    assert write_encoded(path, img)
+    np.testing.assert_array_equal(read_image(path), img)
+
@@ -0,0 +1,67 @@
+"""Tests for the inspection pipeline's SSIM short-circuit."""
+import numpy as np
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+
+from modular_inspection_integrated import pipeline
+from modular_inspection_integrated.config import LightSensitivityConfig, LightSensitivityMode
+
+
+def _board(seed=0, shape=(240, 320)):
+    rng = np.random.default_rng(seed)
+    img = np.full(shape + (3,), 60, np.uint8)
+    for _ in range(30):
+        x, y = rng.integers(0, shape[1] - 30), rng.integers(0, shape[0] - 30)
+        cv2.rectangle(img, (int(x), int(y)), (int(x) + 25, int(y) + 20),
+                      tuple(int(c) for c in rng.integers(80, 255, 3)), -1)
+    return img
+
+
+@pytest.fixture
+def prep_calls(monkeypatch):
+    calls = []
+    real = pipeline.prepare_gray_pair
+
+    def recording(*args, **kwargs):
+        calls.append(args)
+        return real(*args, **kwargs)
+
+    monkeypatch.setattr(pipeline, "prepare_gray_pair", recording)
+    return calls
+
+
+def test_ssim_pass_skips_pixel_prep(prep_calls):
+    board = _board()
+    result = pipeline.run_inspection(board, board.copy(), verbose=False)
+    assert result['method'] == 'SSIM'
+    assert prep_calls == []
+
+
+def test_ssim_fail_runs_pixel_prep_once(prep_calls, monkeypatch):
+    monkeypatch.setattr(pipeline, "calc_ssim", lambda a, b, **kw: (0.0, None))
+    board = _board()
+    result = pipeline.run_inspection(board, board.copy(), verbose=False)
+    assert result['method'] == 'Pixel Matching'
+    assert len(prep_calls) == 1
+
+
+def test_golden_cache_is_reused_and_float_copy_is_lazy():
+    mode = LightSensitivityMode.LOW_LIGHT
+    golden = _board()
+    entry = pipeline._preprocess_golden(golden, mode, LightSensitivityConfig(mode=mode))
+    assert entry._f32 is None
+    assert entry.as_float32().dtype == np.float32
+    again = pipeline._preprocess_golden(golden, mode, LightSensitivityConfig(mode=mode))
+    assert again is entry
+    pipeline.clear_golden_cache()
+    assert pipeline._golden_cache is None
+
+
+def test_golden_cache_does_not_outlive_golden_image():
+    mode = LightSensitivityMode.STANDARD
+    golden = _board()
+    entry = pipeline._preprocess_golden(golden, mode, LightSensitivityConfig(mode=mode))
+    assert entry.proc is golden
+    del golden, entry
+    assert pipeline._golden_cache is None
@@ -0,0 +1,32 @@
+"""Tests for saving cropped QR codes."""
+import os
+
+import numpy as np
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+
+from modular_inspection_integrated import qr_cropper
+from modular_inspection_integrated.qr_cropper import QRCodeExtractor
+
+
+def _results():
+    return [{'id': i, 'data': f"code{i}", 'bbox': (10 * i, 5, 8, 8),
+             'center': (10 * i + 4, 9), 'method': 'test'} for i in range(1, 3)]
+
+
+def test_save_cropped_qr_writes_crops_and_json(tmp_path):
+    image = np.full((40, 60, 3), 128, np.uint8)
+    ex = QRCodeExtractor(output_dir=str(tmp_path))
+    saved = ex.save_cropped_qr(image, results=_results())
+    assert len(saved) == 3
+    assert all(os.path.exists(p) for p in saved)
+
+
+def test_save_cropped_qr_raises_on_failed_write(tmp_path, monkeypatch):
+    monkeypatch.setattr(qr_cropper, "write_encoded", lambda *args: False)
+    image = np.full((40, 60, 3), 128, np.uint8)
+    ex = QRCodeExtractor(output_dir=str(tmp_path))
+    with pytest.raises(IOError):
+        ex.save_cropped_qr(image, results=_results())
+    assert not any(p.suffix == ".json" for p in tmp_path.iterdir())
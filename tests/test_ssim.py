@@ -0,0 +1,35 @@
+"""Tests for the SSIM map implementations."""
+import numpy as np
+import pytest
+
+cv2 = pytest.importorskip("cv2")
+
+from modular_inspection_integrated.ssim import _ssim_map, _ssim_map_opencl, calc_ssim
+
+
+def _pair(seed=0, shape=(64, 80, 3)):
+    rng = np.random.default_rng(seed)
+    a = rng.integers(0, 256, shape, dtype=np.uint8)
+    b = cv2.GaussianBlur(a, (3, 3), 0)
+    return a, b
+
+
+def test_ssim_map_stays_float32():
+    a, b = _pair()
+    assert _ssim_map(a, b).dtype == np.float32
+
+
+def test_ssim_map_opencl_matches_cpu():
+    # Runs through cv2.UMat even without an OpenCL device (CPU fallback)
+    a, b = _pair()
+    cpu = _ssim_map(a, b)
+    umat = _ssim_map_opencl(a, b)
+    assert umat.shape == cpu.shape
+    np.testing.assert_allclose(umat, cpu, atol=1e-3)
+
+
+def test_calc_ssim_identical_images():
+    a, _ = _pair()
+    score, heatmap = calc_ssim(a, a)
+    assert score == pytest.approx(1.0, abs=1e-4)
+    assert heatmap.shape == a.shape